@@ -0,0 +1,122 @@
+import asyncio
+import json
+import threading
+import websockets
+from websockets.exceptions import ConnectionClosed
+
+try:
+    import orjson
+except ImportError:  # optional: falls back to the stdlib json module
+    orjson = None
+
+if orjson is not None:
+    def _dumps(obj):
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads
+else:
+    _dumps = json.dumps
+    _loads = json.loads
+
+SERVER_URI = "ws://192.168.1.133:8765"
+
+# Parameterless commands are serialised once; the stream widget re-sends
+# "capture" every second.
+_ENCODED_COMMANDS = {
+    cmd: _dumps({"cmd": cmd}) for cmd in ("ping", "capture", "start", "stop")
+}
+
+
+def _encode_command(command):
+    # Any JSON-serialisable command is accepted; only {"cmd": name} dicts
+    # can hit the pre-encoded table.
+    if isinstance(command, dict) and len(command) == 1:
+        cmd = command.get("cmd")
+        if isinstance(cmd, str):
+            encoded = _ENCODED_COMMANDS.get(cmd)
+            if encoded is not None:
+                return encoded
+    return _dumps(command)
+
+def _decode_reply(reply):
+    try:
+        return _loads(reply)
+    except ValueError as e:
+        print(f"[WebSocketClient] Invalid reply: {e}")
+        return None
+
+class WebSocketClient:
+    def __init__(self, uri=SERVER_URI, connect=None):
+        self.uri = uri
+        # Injectable so callers can swap the transport without patching
+        # the module-level ``websockets`` import.
+        self._connect_factory = connect or websockets.connect
+        self.websocket = None
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self._start_loop, daemon=True)
+        self.connected = False
+        self.lock = threading.Lock()
+        self.thread.start()
+
+    def _start_loop(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    async def _connect(self):
+        try:
+            self.websocket = await self._connect_factory(self.uri)
+            self.connected = True
+            print("[WebSocketClient] Connected.")
+        except Exception as e:
+            print(f"[WebSocketClient] Connection failed: {e}")
+            self.connected = False
+
+    async def _send_commands(self, commands):
+        # Encoding failures are the caller's mistake: raise them before
+        # touching the connection rather than tearing down a healthy one.
+        messages = [_encode_command(command) for command in commands]
+        if not self.connected:
+            await self._connect()
+        if not self.connected:
+            return [None] * len(messages)
+        try:
+            # The server answers in order on one connection, so every
+            # request can be written before reading the first reply.
+            for message in messages:
+                await self.websocket.send(message)
+            replies = [await self.websocket.recv() for _ in messages]
+        except (ConnectionClosed, OSError) as e:
+            print(f"[WebSocketClient] Error during send/receive: {e}")
+            # Drop the broken connection so the next call reconnects
+            # instead of failing on it forever.
+            await self._disconnect()
+            return [None] * len(messages)
+        return [_decode_reply(reply) for reply in replies]
+
+    async def _disconnect(self):
+        websocket, self.websocket = self.websocket, None
+        self.connected = False
+        if websocket is not None:
+            try:
+                await websocket.close()
+            except Exception as e:
+                print(f"[WebSocketClient] Error closing broken connection: {e}")
+
+    async def _send_command(self, command):
+        return (await self._send_commands([command]))[0]
+
+    def send_command(self, command):
+        future = asyncio.run_coroutine_threadsafe(self._send_command(command), self.loop)
+        return future.result(timeout=5)
+
+    def send_commands(self, commands):
+        """Pipeline ``commands`` and return their responses in order."""
+        commands = list(commands)
+        future = asyncio.run_coroutine_threadsafe(self._send_commands(commands), self.loop)
+        return future.result(timeout=5)
+
+    def close(self):
+        if self.websocket:
+            close_future = asyncio.run_coroutine_threadsafe(self.websocket.close(), self.loop)
+            close_future.result(timeout=5)
+        self.loop.call_soon_threadsafe(self.loop.stop)
\ No newline at end of file
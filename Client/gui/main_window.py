@@ -1,7 +1,7 @@
 import sys
 from PyQt6.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QWidget
 from gui.widgets.stream_widget import StreamWidget
-from network.ws_client import WebSocketClient
+from connection.ws_client import WebSocketClient
 
 class ImageStreamViewer(QMainWindow):
     def __init__(self):
@@ -1,6 +1,6 @@
 import base64
 from PyQt6.QtCore import QTimer, Qt
-from PyQt6.QtGui import QPixmap, QImage
+from PyQt6.QtGui import QPixmap
 from PyQt6.QtWidgets import QLabel, QVBoxLayout, QWidget
 
 class StreamWidget(QWidget):
@@ -30,6 +30,7 @@ class StreamWidget(QWidget):
                 self.image_label.setPixmap(pixmap)
 
     def base64_to_pixmap(self, base64_str):
-        img_bytes = base64.b64decode(base64_str)
-        img = QImage.fromData(img_bytes)
-        return QPixmap.fromImage(img)
\ No newline at end of file
+        # Decode the JPEG straight into a pixmap, skipping the QImage copy.
+        pixmap = QPixmap()
+        pixmap.loadFromData(base64.b64decode(base64_str))
+        return pixmap
\ No newline at end of file
@@ -1,4 +1,4 @@
-from network.ws_client import WebSocketClient
+from connection.ws_client import WebSocketClient
 
 def main():
     print("Testing WebSocket connection...")
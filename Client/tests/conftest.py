@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import importlib
+import sys
+import types
+from pathlib import Path
+
+# Runs before the test modules in this directory are imported, so the tests
+# can import ``connection.ws_client`` the way ``run.py`` lays out the path.
+CLIENT_ROOT = str(Path(__file__).resolve().parents[1])
+if CLIENT_ROOT not in sys.path:
+    sys.path.insert(0, CLIENT_ROOT)
+
+# The tests inject their own ``connect``; ``websockets`` only has to import.
+try:
+    importlib.import_module("websockets")
+except ImportError:
+    websockets_stub = types.ModuleType("websockets")
+    exceptions_stub = types.ModuleType("websockets.exceptions")
+    exceptions_stub.ConnectionClosed = type("ConnectionClosed", (Exception,), {})
+    websockets_stub.exceptions = exceptions_stub
+    sys.modules.setdefault("websockets", websockets_stub)
+    sys.modules.setdefault("websockets.exceptions", exceptions_stub)
@@ -0,0 +1,96 @@
+import json
+
+import pytest
+
+from connection.ws_client import WebSocketClient, _encode_command
+
+
+class _FakeSocket:
+    """Answers each sent command in order; optionally fails on send."""
+
+    def __init__(self, log, fail=False):
+        self.log = log
+        self.fail = fail
+        self.pending = []
+        self.closed = False
+
+    async def send(self, message):
+        if self.fail:
+            raise ConnectionError("connection reset")
+        self.log.append(("send", json.loads(message)["cmd"]))
+        self.pending.append(message)
+
+    async def recv(self):
+        message = self.pending.pop(0)
+        self.log.append(("recv", json.loads(message)["cmd"]))
+        return json.dumps({"status": "ok", "cmd": json.loads(message)["cmd"]})
+
+    async def close(self):
+        self.closed = True
+
+
+class _FakeConnect:
+    def __init__(self, *fail_flags):
+        self.fail_flags = list(fail_flags)
+        self.log = []
+        self.sockets = []
+
+    async def __call__(self, uri):
+        socket = _FakeSocket(self.log, fail=self.fail_flags.pop(0))
+        self.sockets.append(socket)
+        return socket
+
+
+def test_send_commands_pipelines_requests_before_reading_replies():
+    connect = _FakeConnect(False)
+    client = WebSocketClient("ws://test", connect=connect)
+    try:
+        replies = client.send_commands([{"cmd": "ping"}, {"cmd": "capture"}])
+    finally:
+        client.close()
+
+    assert [reply["cmd"] for reply in replies] == ["ping", "capture"]
+    assert connect.log == [
+        ("send", "ping"),
+        ("send", "capture"),
+        ("recv", "ping"),
+        ("recv", "capture"),
+    ]
+
+
+def test_broken_connection_is_closed_and_replaced():
+    connect = _FakeConnect(True, False)
+    client = WebSocketClient("ws://test", connect=connect)
+    try:
+        assert client.send_command({"cmd": "ping"}) is None
+        broken = connect.sockets[0]
+        assert broken.closed
+        assert client.websocket is None
+        assert not client.connected
+
+        assert client.send_command({"cmd": "ping"}) == {"status": "ok", "cmd": "ping"}
+        assert len(connect.sockets) == 2
+    finally:
+        client.close()
+    assert connect.sockets[1].closed
+
+
+def test_unencodable_command_raises_without_dropping_the_connection():
+    connect = _FakeConnect(False)
+    client = WebSocketClient("ws://test", connect=connect)
+    try:
+        assert client.send_command({"cmd": "ping"}) == {"status": "ok", "cmd": "ping"}
+        with pytest.raises(TypeError):
+            client.send_command({"cmd": "move", "speed": object()})
+        assert client.connected
+        assert not connect.sockets[0].closed
+        assert client.send_command({"cmd": "ping"}) == {"status": "ok", "cmd": "ping"}
+        assert len(connect.sockets) == 1
+    finally:
+        client.close()
+
+
+def test_encode_command_accepts_any_json_value():
+    assert json.loads(_encode_command({"cmd": "ping"})) == {"cmd": "ping"}
+    assert json.loads(_encode_command(["ping", 1])) == ["ping", 1]
+    assert json.loads(_encode_command("ping")) == "ping"
@@ -4,16 +4,11 @@ import os
 import sys
 import threading
 import types
-from pathlib import Path
 from typing import Any, Dict
 from unittest import mock
 
 import pytest
 
-SERVER_ROOT = Path(__file__).resolve().parents[2]
-if str(SERVER_ROOT) not in sys.path:
-    sys.path.insert(0, str(SERVER_ROOT))
-
 mind_stub = types.ModuleType("mind")
 mind_stub.__path__ = []  # type: ignore[attr-defined]
 sys.modules.setdefault("mind", mind_stub)
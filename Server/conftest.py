@@ -0,0 +1,10 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+# Runs before any test module under Server/ is imported, so the tests can
+# import ``app``, ``core``, ``mind``... the way ``run.py`` lays out the path.
+SERVER_ROOT = str(Path(__file__).resolve().parent)
+if SERVER_ROOT not in sys.path:
+    sys.path.insert(0, SERVER_ROOT)
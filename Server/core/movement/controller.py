@@ -8,6 +8,8 @@ from queue import Empty, Queue
 from typing import Any, Optional, Union
 from pathlib import Path
 
+import numpy as np
+
 from . import kinematics, posture, data
 from .gait_runner import GaitRunner
 from .hardware import Hardware
@@ -154,6 +156,8 @@ class MovementController:
         self.order = ["", "", "", "", ""]
         self.point = [[0, 99, 10], [0, 99, 10], [0, 99, -10], [0, 99, -10]]
         self.angle = [[90, 0, 0], [90, 0, 0], [90, 0, 0], [90, 0, 0]]
+        # Reused by posture.attitude() so balance updates do not allocate.
+        self._pos_scratch = np.zeros((3, 4))
         self._prev_t_gait = None
         self._is_turning = False
         self._turn_dir = 0
@@ -202,6 +206,39 @@ class MovementController:
         else:
             print("This coordinate point is out of the active range")
 
+    # ------------------------------------------------------------------
+    def _drive_trajectory(self, traj: np.ndarray, tick_time: Optional[float] = None) -> None:
+        """Drive the legs through the ``(N, 4, 3)`` foot positions in ``traj``.
+
+        Inverse kinematics and calibration are evaluated for every frame in
+        one pass; the per-frame loop only issues the servo writes, optionally
+        paced by ``tick_time`` seconds. ``point`` and ``angle`` end up as
+        :meth:`run` would leave them after the last frame.
+        """
+        traj = np.asarray(traj, dtype=float)
+        self.point = traj[-1].tolist()
+        if self.torque_off:
+            self.hardware.relax()
+            return
+        angles = kinematics.coordinate_to_angle_batch(traj)
+        valid = kinematics.points_in_range(traj) & np.isfinite(angles).all(axis=(1, 2))
+        servo_angles = self.hardware.calibrate_angles(angles)
+        last = None
+        for k in range(len(traj)):
+            if not valid[k]:
+                print("This coordinate point is out of the active range")
+                continue
+            try:
+                self.hardware.send_angles(servo_angles[k])
+            except Exception as e:
+                print("Exception during run():", e)
+                continue
+            last = k
+            if tick_time:
+                time.sleep(tick_time)
+        if last is not None:
+            self.angle = servo_angles[last].tolist()
+
     # ------------------------------------------------------------------
     def apply_servo_overrides(self, overrides: dict[int, float]) -> None:
         """Direct servo channel overrides with head clamping."""
@@ -251,14 +288,7 @@ class MovementController:
 
     # ------------------------------------------------------------------
     def checkPoint(self) -> bool:
-        flag = True
-        leg_lenght = [0, 0, 0, 0, 0, 0]
-        for i in range(4):
-            leg_lenght[i] = (self.point[i][0] ** 2 + self.point[i][1] ** 2 + self.point[i][2] ** 2) ** 0.5
-        for i in range(4):
-            if leg_lenght[i] > 130 or leg_lenght[i] < 25:
-                flag = False
-        return flag
+        return kinematics.check_point(self.point)
 
     # ------------------------------------------------------------------
     def clamp_speed(self, min_val: Optional[int] = None, max_val: Optional[int] = None) -> None:
@@ -275,9 +305,6 @@ class MovementController:
 
     # ------------------------------------------------------------------
     def changeCoordinates(self, move_order: str, X1: float = 0, Y1: float = 96, Z1: float = 0, X2: float = 0, Y2: float = 96, Z2: float = 0, pos: Optional[Any] = None) -> None:  # noqa: N802,E501
-        if pos is None:
-            import numpy as np
-            pos = np.mat(np.zeros((3, 4)))
         if move_order == "turnLeft":
             self.set_leg_position(self.FL, -X1 + 10, Y1, Z1 + 10)
             self.set_leg_position(self.RL, -X2 + 10, Y2, -Z2 + 10)
@@ -293,9 +320,13 @@ class MovementController:
                 self.set_leg_position(3 * i, X1 + 10, Y1, self.point[3 * i][self.Z])
                 self.set_leg_position(1 + i, X2 + 10, Y2, self.point[1 + i][self.Z])
         elif move_order == "Attitude Angle":
+            if pos is None:
+                pos = np.zeros((3, 4))
+            # Copy out as plain floats: ``pos`` may be a reused scratch buffer.
+            pos = np.asarray(pos, dtype=float).tolist()
             for i in range(2):
-                self.set_leg_position(3 - i, pos[0, 1 + 2 * i] + 10, pos[2, 1 + 2 * i], pos[1, 1 + 2 * i])
-                self.set_leg_position(i, pos[0, 2 * i] + 10, pos[2, 2 * i], pos[1, 2 * i])
+                self.set_leg_position(3 - i, pos[0][1 + 2 * i] + 10, pos[2][1 + 2 * i], pos[1][1 + 2 * i])
+                self.set_leg_position(i, pos[0][2 * i] + 10, pos[2][2 * i], pos[1][2 * i])
         else:
             for i in range(2):
                 self.set_leg_position(i * 2, X1 + 10, Y1, Z1 + ((-1) ** i) * 10)
@@ -315,23 +346,15 @@ class MovementController:
         self.stop_requested = False
         self.torque_off = False
         if flag:
-            p = [[55, 78, 0], [55, 78, 0], [55, 78, 0], [55, 78, 0]]
-            for i in range(4):
-                p[i][0] = (self.point[i][0] - p[i][0]) / 50
-                p[i][1] = (self.point[i][1] - p[i][1]) / 50
-                p[i][2] = (self.point[i][2] - p[i][2]) / 50
-            for _ in range(1, 51):
-                for i in range(4):
-                    self.point[i][0] -= p[i][0]
-                    self.point[i][1] -= p[i][1]
-                    self.point[i][2] -= p[i][2]
-                self.run()
+            relaxed = np.array([[55, 78, 0], [55, 78, 0], [55, 78, 0], [55, 78, 0]], dtype=float)
+            traj = np.linspace(np.asarray(self.point, dtype=float), relaxed, 51)[1:]
+            self._drive_trajectory(traj)
         self.cpg.set_velocity(0.0, 0.0, 0.0)
 
     # ------------------------------------------------------------------
     def load_points_from_file(self, path: Path) -> None:
         """Replace current leg points with coordinates from ``path``."""
-        self.point = data.load_points(path)
+        self.point = data.load_points(path).tolist()
 
     # ------------------------------------------------------------------
     def save_points_to_file(self, path: Path) -> None:
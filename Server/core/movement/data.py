@@ -7,34 +7,35 @@ so the functions are easy to unit test and mock.
 from __future__ import annotations
 
 from pathlib import Path
-from typing import List
+from typing import Sequence
 
+import numpy as np
 
-def load_points(path: Path) -> List[List[int]]:
+
+def load_points(path: Path) -> np.ndarray:
     """Return a matrix of integers read from ``path``.
 
     The expected file format is a series of lines with tab separated
     integers representing the *x*, *y* and *z* coordinates for each
-    leg.  Empty trailing lines are ignored.
+    leg.  Empty trailing lines are ignored.  The result is an ``int32``
+    array with one row per line.
     """
-    lines = path.read_text().splitlines()
-    return [
-        [int(col) for col in line.split("\t") if col]
-        for line in lines if line.strip()
-    ]
+    return np.loadtxt(path, dtype=np.int32, delimiter="\t", ndmin=2)
+
 
+def save_points(path: Path, data: Sequence[Sequence[int]]) -> None:
+    """Persist ``data`` into ``path`` using tab separated values.
 
-def save_points(path: Path, data: List[List[int]]) -> None:
-    """Persist ``data`` into ``path`` using tab separated values."""
-    with path.open("w") as fh:
-        for row in data:
-            fh.write("\t".join(str(v) for v in row) + "\n")
+    Values are rounded to the nearest integer; ``%d`` alone would truncate
+    float coordinates towards zero.
+    """
+    np.savetxt(path, np.rint(np.asarray(data)).astype(int), fmt="%d", delimiter="\t")
 
 
 # ---------------------------------------------------------------------------
 # Backwards compatible wrappers
 
-def read_from_txt(name: str) -> List[List[int]]:
+def read_from_txt(name: str) -> np.ndarray:
     """Legacy wrapper around :func:`load_points`.
 
     ``name`` should be provided without extension.  The file is looked up
@@ -43,6 +44,6 @@ def read_from_txt(name: str) -> List[List[int]]:
     return load_points(Path(__file__).with_name(f"{name}.txt"))
 
 
-def save_to_txt(matrix: List[List[int]], name: str) -> None:
+def save_to_txt(matrix: Sequence[Sequence[int]], name: str) -> None:
     """Legacy wrapper around :func:`save_points`."""
     save_points(Path(__file__).with_name(f"{name}.txt"), matrix)
@@ -1,8 +1,11 @@
 """Gait generation helpers based on a Central Pattern Generator (CPG)."""
 from __future__ import annotations
 
+import asyncio
 import time
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
+
+import numpy as np
 
 from .gait_cpg import CPG
 
@@ -79,8 +82,14 @@ class GaitRunner:
                 ctrl.set_leg_position(i, 10, base_y, Z_BASE[i])
 
     # ------------------------------------------------------------------
-    def step_move(self, ctrl: Any, axis: str, mode: str, direction: str, cycles: int = 1) -> None:
-        """Run ``cycles`` of the gait generator according to the direction."""
+    def _gait_ticks(
+        self, ctrl: Any, axis: str, direction: str, cycles: int
+    ) -> Iterator[float]:
+        """Drive ``cycles`` gait cycles, yielding the wait before each next tick.
+
+        Shared by :meth:`step_move` and :meth:`step_move_async`, which only
+        differ in how they sleep.
+        """
         ctrl.clamp_speed()
         tick_time = 1.0 / ctrl.speed
         tick = time.monotonic()
@@ -119,7 +128,40 @@ class GaitRunner:
             if phase0 < prev_phase:
                 done += 1
             prev_phase = phase0
-            tick = ctrl.wait_for_next_tick(tick, tick_time)
+            tick += tick_time
+            yield max(0.0, tick - time.monotonic())
+
+    # ------------------------------------------------------------------
+    async def step_move_async(
+        self, ctrl: Any, axis: str, mode: str, direction: str, cycles: int = 1
+    ) -> None:
+        """Run ``cycles`` of the gait generator according to the direction.
+
+        Waits between ticks are ``asyncio.sleep`` calls so other coroutines on
+        the same loop keep running while the gait is paced.
+        """
+        for delay in self._gait_ticks(ctrl, axis, direction, cycles):
+            await asyncio.sleep(delay)
+
+    # ------------------------------------------------------------------
+    def step_move(self, ctrl: Any, axis: str, mode: str, direction: str, cycles: int = 1) -> None:
+        """Run ``cycles`` of the gait generator, blocking between ticks.
+
+        Raises :class:`RuntimeError` when called from a thread that is running
+        an event loop, since the whole gait would stall that loop; await
+        :meth:`step_move_async` there instead.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            raise RuntimeError(
+                "step_move() would block the running event loop; "
+                "await step_move_async() instead"
+            )
+        for delay in self._gait_ticks(ctrl, axis, direction, cycles):
+            time.sleep(delay)
 
     # ------------------------------------------------------------------
     def forWard(self, ctrl: Any) -> None:  # noqa: N802
@@ -153,17 +195,12 @@ class GaitRunner:
         ctrl._stride_dir_z = 0
         ctrl.stop_requested = True
 
-        p = [[10, ctrl.height, 10], [10, ctrl.height, 10], [10, ctrl.height, -10], [10, ctrl.height, -10]]
-        for i in range(4):
-            p[i][0] = (p[i][0] - ctrl.point[i][0]) / 50
-            p[i][1] = (p[i][1] - ctrl.point[i][1]) / 50
-            p[i][2] = (p[i][2] - ctrl.point[i][2]) / 50
-        for _ in range(50):
-            for i in range(4):
-                ctrl.point[i][0] += p[i][0]
-                ctrl.point[i][1] += p[i][1]
-                ctrl.point[i][2] += p[i][2]
-            ctrl.run()
+        neutral = np.array(
+            [[10, ctrl.height, 10], [10, ctrl.height, 10], [10, ctrl.height, -10], [10, ctrl.height, -10]],
+            dtype=float,
+        )
+        traj = np.linspace(np.asarray(ctrl.point, dtype=float), neutral, 51)[1:]
+        ctrl._drive_trajectory(traj)
 
 
 __all__ = ["GaitRunner"]
@@ -57,6 +57,8 @@ class GesturePlayer:
 
     Thread-safety:
       - play() can run blocking or in a thread; stop() cancels.
+      - started_event is set once playback of the current sequence begins,
+        so callers can wait on it instead of sleeping.
     """
     def __init__(self, controller=None, hardware=None, kinematics=None, tick_hz: float = 100.0):
         self.controller = controller
@@ -65,6 +67,7 @@ class GesturePlayer:
         self.tick_hz = tick_hz
         self._thread: Optional[threading.Thread] = None
         self._stop = threading.Event()
+        self.started_event = threading.Event()
 
     # -------- public API --------
     def play(self, seq: Sequence, blocking: bool = False) -> None:
@@ -75,6 +78,7 @@ class GesturePlayer:
         """
         self.stop()
         self._stop.clear()
+        self.started_event.clear()
         if blocking:
             self._run(seq)
         else:
@@ -94,6 +98,7 @@ class GesturePlayer:
 
     # -------- helpers --------
     def _run(self, seq: Sequence) -> None:
+        self.started_event.set()
         if not seq.frames:
             return
         frames = sorted(seq.frames, key=lambda f: f.t_ms)
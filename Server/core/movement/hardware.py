@@ -6,9 +6,10 @@ import logging
 from pathlib import Path
 from typing import Iterable, List
 
-from .kinematics import coordinate_to_angle, clamp
+import numpy as np
+
+from .kinematics import coordinate_to_angle
 from .data import load_points
-from .servo import Servo
 from .gait_cpg import CPG
 
 
@@ -34,7 +35,13 @@ class Hardware:
 
     # ------------------------------------------------------------------
     def setup_hardware(self) -> None:
-        """Initialise the individual hardware components used for actuation."""
+        """Initialise the individual hardware components used for actuation.
+
+        The servo driver (and through it ``smbus``) is imported here so the
+        kinematics and posture helpers stay importable on hosts without I2C.
+        """
+        from .servo import Servo
+
         self.servo = Servo()
         self.cpg = CPG("walk")
 
@@ -49,7 +56,7 @@ class Hardware:
         """Compute calibration offsets from reference points."""
         for i in range(4):
             self.calibration_angle[i][0], self.calibration_angle[i][1], self.calibration_angle[i][2] = coordinate_to_angle(
-                self.calibration_point[i][0], self.calibration_point[i][1], self.calibration_point[i][2]
+                self.calibration_point[i, 0], self.calibration_point[i, 1], self.calibration_point[i, 2]
             )
         for i in range(4):
             angle[i][0], angle[i][1], angle[i][2] = coordinate_to_angle(
@@ -62,16 +69,37 @@ class Hardware:
 
     # ------------------------------------------------------------------
     def _apply_calibration_to_angles(self, angle: List[List[float]]) -> None:
-        for i in range(2):
-            # Left legs
-            angle[i][0] = clamp(angle[i][0] + self.calibration_angle[i][0], 0, 180)
-            angle[i][1] = clamp(90 - (angle[i][1] + self.calibration_angle[i][1]), 0, 180)
-            angle[i][2] = clamp(angle[i][2] + self.calibration_angle[i][2], 0, 180)
-
-            # Right legs
-            angle[i + 2][0] = clamp(angle[i + 2][0] + self.calibration_angle[i + 2][0], 0, 180)
-            angle[i + 2][1] = clamp(90 + angle[i + 2][1] + self.calibration_angle[i + 2][1], 0, 180)
-            angle[i + 2][2] = clamp(180 - (angle[i + 2][2] + self.calibration_angle[i + 2][2]), 0, 180)
+        # Runs every tick, so the [0, 180] clamp is inlined rather than
+        # paying a function call per joint.
+        for i in range(4):
+            leg, cal = angle[i], self.calibration_angle[i]
+            a = leg[0] + cal[0]
+            if i < 2:  # Left legs
+                b = 90 - (leg[1] + cal[1])
+                c = leg[2] + cal[2]
+            else:  # Right legs
+                b = 90 + leg[1] + cal[1]
+                c = 180 - (leg[2] + cal[2])
+            leg[0] = 0 if a < 0 else (180 if a > 180 else a)
+            leg[1] = 0 if b < 0 else (180 if b > 180 else b)
+            leg[2] = 0 if c < 0 else (180 if c > 180 else c)
+
+    # ------------------------------------------------------------------
+    def calibrate_angles(self, angles: np.ndarray) -> np.ndarray:
+        """Vectorised :meth:`_apply_calibration_to_angles` for ``(..., 4, 3)`` poses.
+
+        Returns a new array of servo angles clipped to ``[0, 180]``.
+        """
+        out = np.asarray(angles, dtype=float) + np.asarray(self.calibration_angle, dtype=float)
+        out[..., :2, 1] = 90 - out[..., :2, 1]
+        out[..., 2:, 1] += 90
+        out[..., 2:, 2] = 180 - out[..., 2:, 2]
+        return np.clip(out, 0, 180, out=out)
+
+    # ------------------------------------------------------------------
+    def send_angles(self, angle: Iterable[Iterable[float]]) -> None:
+        """Dispatch already calibrated joint angles to the servos."""
+        self._send_angles_to_servos(angle)
 
     # ------------------------------------------------------------------
     def _send_angles_to_servos(self, angle: Iterable[Iterable[float]]) -> None:
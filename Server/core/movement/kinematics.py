@@ -10,6 +10,8 @@ from __future__ import annotations
 import math
 from typing import Tuple
 
+import numpy as np
+
 
 def coordinate_to_angle(
     x: float,
@@ -39,6 +41,52 @@ def coordinate_to_angle(
     return a, b, c
 
 
+def coordinate_to_angle_batch(
+    points: np.ndarray,
+    l1: float = 23,
+    l2: float = 55,
+    l3: float = 55,
+) -> np.ndarray:
+    """Vectorised :func:`coordinate_to_angle` over an ``(..., 3)`` array.
+
+    Returns an array of the same shape holding whole-degree joint angles.
+    The math stays in double precision like the scalar path: the ``asin`` and
+    ``acos`` arguments are rounded to two decimals first, and single precision
+    is enough to tip that rounding and land a degree off. Unreachable points
+    yield ``nan`` instead of raising.
+    """
+    points = np.asarray(points, dtype=float)
+    x, y, z = points[..., 0], points[..., 1], points[..., 2]
+    a = math.pi / 2 - np.arctan2(z, y)
+    x_4 = l1 * np.sin(a)
+    x_5 = l1 * np.cos(a)
+    l23 = np.sqrt((z - x_5) ** 2 + (y - x_4) ** 2 + x ** 2)
+    w = x / l23
+    v = (l2 * l2 + l23 * l23 - l3 * l3) / (2 * l2 * l23)
+    with np.errstate(invalid="ignore"):
+        b = np.arcsin(np.round(w, 2)) - np.arccos(np.round(v, 2))
+        c = math.pi - np.arccos(np.round((l2 ** 2 + l3 ** 2 - l23 ** 2) / (2 * l3 * l2), 2))
+    return np.rint(np.degrees(np.stack((a, b, c), axis=-1)))
+
+
+def check_point(point, min_len: float = 25, max_len: float = 130) -> bool:
+    """Return ``True`` when every leg of the 4x3 ``point`` matrix is reachable."""
+    for x, y, z in point:
+        length = (x ** 2 + y ** 2 + z ** 2) ** 0.5
+        if length > max_len or length < min_len:
+            return False
+    return True
+
+
+def points_in_range(points: np.ndarray, min_len: float = 25, max_len: float = 130) -> np.ndarray:
+    """Return whether every leg of each ``(..., 4, 3)`` pose is reachable.
+
+    Batched counterpart of :func:`check_point`.
+    """
+    lengths = np.linalg.norm(np.asarray(points, dtype=float), axis=-1)
+    return np.all((lengths >= min_len) & (lengths <= max_len), axis=-1)
+
+
 def angle_to_coordinate(
     a: float,
     b: float,
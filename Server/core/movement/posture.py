@@ -2,45 +2,69 @@
 from __future__ import annotations
 
 import math
-from typing import Any
+from functools import lru_cache
+from typing import Any, Optional
 
 import numpy as np
 
 
+#: Hip positions relative to the body centre, one column per leg.
+_BODY_STRUC = np.array(
+    [[136 / 2, 76 / 2, 0], [136 / 2, -76 / 2, 0], [-136 / 2, 76 / 2, 0], [-136 / 2, -76 / 2, 0]],
+    dtype=float,
+).T
+
+
+@lru_cache(maxsize=8)
+def _footpoint_struc(drop: float) -> np.ndarray:
+    """Foot layout ``drop`` below the hips, one column per leg (read-only)."""
+    w = 76
+    l = 136
+    footpoint = np.array([
+        [(l / 2), (w / 2) + 10, drop],
+        [(l / 2), (-w / 2) - 10, drop],
+        [(-l / 2), (w / 2) + 10, drop],
+        [(-l / 2), (-w / 2) - 10, drop],
+    ], dtype=float).T
+    footpoint.flags.writeable = False
+    return footpoint
+
+
 def map_range(value: float, from_low: float, from_high: float, to_low: float, to_high: float) -> float:
     """Linear mapping of ``value`` from one range to another."""
     return (to_high - to_low) * (value - from_low) / (from_high - from_low) + to_low
 
 
-def posture_balance(r: float, p: float, y: float, h: float = 1, *, height: float = 99) -> np.matrix:
+def posture_balance(
+    r: float,
+    p: float,
+    y: float,
+    h: float = 1,
+    *,
+    height: float = 99,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
     """Compute leg positions that keep the body balanced.
 
     Parameters mirror the original implementation.  ``height`` is the
-    nominal body height used when ``h`` is zero.
+    nominal body height used when ``h`` is zero.  When ``out`` is given the
+    ``(3, 4)`` float64 result is written into it instead of a freshly
+    allocated array, so periodic callers can reuse one scratch buffer.
     """
-    b = 76
-    w = 76
-    l = 136
     if h != 0:
         height = h
-    pos = np.mat([0.0, 0.0, h]).T
-    rpy = np.array([r, p, y]) * math.pi / 180
-    R, P, Y = rpy[0], rpy[1], rpy[2]
-    rotx = np.mat([[1, 0, 0], [0, math.cos(R), -math.sin(R)], [0, math.sin(R), math.cos(R)]])
-    roty = np.mat([[math.cos(P), 0, -math.sin(P)], [0, 1, 0], [math.sin(P), 0, math.cos(P)]])
-    rotz = np.mat([[math.cos(Y), -math.sin(Y), 0], [math.sin(Y), math.cos(Y), 0], [0, 0, 1]])
-    rot_mat = rotx * roty * rotz
-    body_struc = np.mat([[l / 2, b / 2, 0], [l / 2, -b / 2, 0], [-l / 2, b / 2, 0], [-l / 2, -b / 2, 0]]).T
-    footpoint_struc = np.mat([
-        [(l / 2), (w / 2) + 10, height - h],
-        [(l / 2), (-w / 2) - 10, height - h],
-        [(-l / 2), (w / 2) + 10, height - h],
-        [(-l / 2), (-w / 2) - 10, height - h],
-    ]).T
-    AB = np.mat(np.zeros((3, 4)))
-    for i in range(4):
-        AB[:, i] = pos + rot_mat * footpoint_struc[:, i] - body_struc[:, i]
-    return AB
+    R, P, Y = math.radians(r), math.radians(p), math.radians(y)
+    rotx = np.array([[1, 0, 0], [0, math.cos(R), -math.sin(R)], [0, math.sin(R), math.cos(R)]])
+    roty = np.array([[math.cos(P), 0, -math.sin(P)], [0, 1, 0], [math.sin(P), 0, math.cos(P)]])
+    rotz = np.array([[math.cos(Y), -math.sin(Y), 0], [math.sin(Y), math.cos(Y), 0], [0, 0, 1]])
+    rot_mat = rotx @ roty @ rotz
+    # pos + R @ footpoint - body, evaluated for all four legs at once.
+    if out is None:
+        out = np.empty((3, 4))
+    np.matmul(rot_mat, _footpoint_struc(height - h), out=out)
+    out[2] += h
+    np.subtract(out, _BODY_STRUC, out=out)
+    return out
 
 
 def up_and_down(controller: Any, value: float) -> None:
@@ -59,5 +83,7 @@ def attitude(controller: Any, roll: float, pitch: float, yaw: float) -> None:
     r = map_range(int(roll), -20, 20, -10, 10)
     p = map_range(int(pitch), -20, 20, -10, 10)
     y = map_range(int(yaw), -20, 20, -10, 10)
-    pos = posture_balance(r, p, y, 0, height=controller.height)
+    pos = posture_balance(
+        r, p, y, 0, height=controller.height, out=getattr(controller, "_pos_scratch", None)
+    )
     controller.changeCoordinates("Attitude Angle", pos=pos)
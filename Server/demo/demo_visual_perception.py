@@ -1,6 +1,6 @@
 import os
 import sys
-import base64, datetime, time
+import base64, datetime, threading
 
 # Ensure the Server package is on the Python path when run directly
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
@@ -13,13 +13,16 @@ def main():
     ts = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
     filename = f"logs/{ts}.jpg"
 
+    got_frame = threading.Event()
+
+    def on_frame(_data):
+        if cam.get_last_processed_encoded():
+            got_frame.set()
+
     cam.start()
-    cam.start_stream(interval_sec=0.2)
-    deadline = time.time() + 3.0
-    encoded = None
-    while time.time() < deadline and not encoded:
-        encoded = cam.get_last_processed_encoded()
-        time.sleep(0.05)
+    cam.start_stream(interval_sec=0.2, on_frame=on_frame)
+    got_frame.wait(timeout=3.0)
+    encoded = cam.get_last_processed_encoded()
     cam.stop()
 
     if not encoded:
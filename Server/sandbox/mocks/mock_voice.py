@@ -2,30 +2,73 @@
 from __future__ import annotations
 
 import logging
+import queue
+import threading
 from typing import Optional
 
 
 class MockVoiceService:
-    """Simulate STT/TTS interactions through the terminal."""
+    """Simulate STT/TTS interactions through the terminal.
+
+    Console lines are read by a background thread and queued, so
+    :meth:`listen` blocks on the queue instead of the caller polling.
+    """
 
     def __init__(self) -> None:
         self.logger = logging.getLogger("mock.voice")
         self._running = False
+        # ``None`` is queued by stop() to wake a blocked listen().
+        self._utterances: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._reader: Optional[threading.Thread] = None
 
     def start(self) -> None:
         if self._running:
             return
+        # Drop the stop() sentinel and anything queued while stopped, so the
+        # first listen() after a restart waits for fresh input.
+        self._drain()
         self._running = True
+        if self._reader is None or not self._reader.is_alive():
+            self._reader = threading.Thread(
+                target=self._read_console, name="mock-voice-input", daemon=True
+            )
+            self._reader.start()
         self.logger.debug("[MOCK] Voice interface started")
 
-    def listen(self) -> Optional[str]:
+    def _drain(self) -> None:
+        while True:
+            try:
+                self._utterances.get_nowait()
+            except queue.Empty:
+                return
+
+    def _read_console(self) -> None:
+        while True:
+            try:
+                text = input("[YOU]: ")
+            except (EOFError, OSError):
+                self.logger.debug("[MOCK] Voice input stream closed")
+                return
+            # The reader outlives stop(); lines typed meanwhile are ignored.
+            if self._running:
+                self.push(text)
+
+    def push(self, text: str) -> None:
+        """Queue ``text`` as if it had been heard."""
+
+        self._utterances.put(text)
+
+    def listen(self, timeout: Optional[float] = None) -> Optional[str]:
+        """Return the next utterance, waiting up to ``timeout`` seconds."""
+
         if not self._running:
             self.logger.debug("[MOCK] Voice interface not running; listen() ignored")
             return None
         try:
-            text = input("[YOU]: ")
-        except EOFError:
-            self.logger.debug("[MOCK] Voice input stream closed")
+            text = self._utterances.get(timeout=timeout)
+        except queue.Empty:
+            return None
+        if text is None:
             return None
         text = text.strip()
         self.logger.debug("[MOCK] Heard: %s", text)
@@ -39,4 +82,5 @@ class MockVoiceService:
         if not self._running:
             return
         self._running = False
+        self._utterances.put(None)
         self.logger.debug("[MOCK] Voice interface stopped")
@@ -7,263 +7,370 @@ Never intended for use with physical hardware.
 Entry point for running the Lumo runtime in sandbox mode."""
 from __future__ import annotations
 
+import functools
+import http.client
+import importlib
+import importlib.abc
 import importlib.machinery
 import importlib.util
 import json
 import logging
+import os
+import socket
 import sys
 import threading
 import time
 import types
 import urllib.error
+import urllib.parse
 import urllib.request
-from pathlib import Path
-from typing import Callable, Dict, Iterable, Optional, Tuple
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Mapping, Optional, Tuple
 
 
-PROJECT_ROOT = Path(__file__).resolve().parents[2]
-SERVER_ROOT = PROJECT_ROOT / "Server"
+# Plain strings: resolve() would stat every path component at import time.
+_HERE = os.path.abspath(__file__)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(_HERE)))
+SERVER_ROOT = PROJECT_ROOT + os.sep + "Server"
+_APP_CONFIG_PATH = os.path.join(SERVER_ROOT, "app", "app.json")
+
+# Shared read-only configs; passed by reference instead of rebuilt per call.
+_EMPTY_MAPPING: Mapping[str, object] = types.MappingProxyType({})
+_SANDBOX_CFG: Mapping[str, object] = types.MappingProxyType({"mode": "sandbox"})
+_CONV_CFG: Mapping[str, object] = types.MappingProxyType({"enable": True})
+
+# Bound once; compact separators keep LLM request bodies small.
+_JSON_ENCODE = json.JSONEncoder(separators=(",", ":")).encode
+_JSON_DECODE = json.JSONDecoder().decode
 
 if __package__ in {None, ""}:
     __package__ = "Server.sandbox"
 
 logger = logging.getLogger(__name__)
+_COGNITIVE_LOGGER = logging.getLogger("sandbox.cognitive")
+_MOCK_VOICE_LOGGER = logging.getLogger("mock.voice")
 
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
+#: How long conversation loops block waiting for an utterance before
+#: re-checking their stop events.
+_LISTEN_TIMEOUT = 0.5
 
-from ..interface.sensor_controller import SensorController
-from ..interface.sensor_gateway import SensorGateway
-from ..mind.proprioception.body_model import BodyModel
+# Survive importlib.reload(), which re-executes this module in place.
+_PATH_READY = globals().get("_PATH_READY", False)
+_STUBS_READY = globals().get("_STUBS_READY", False)
 
 
-def _install_sandbox_stubs() -> None:
-    """Inject lightweight stand-ins for heavy hardware modules."""
+@functools.lru_cache(maxsize=None)
+def _subdirs(root: str) -> frozenset:
+    """Names of the directories directly under ``root``, from one scandir."""
 
-    core_module = sys.modules.get("core")
-    if core_module is None:
+    try:
+        with os.scandir(root) as entries:
+            return frozenset(entry.name for entry in entries if entry.is_dir())
+    except OSError:
+        return frozenset()
+
+
+def _ensure_paths() -> None:
+    """Mirror the ``sys.path`` setup of ``Server/run.py`` once per process.
+
+    Prepends ``Server/{network,lib,core,app}``, ``Server`` and the project
+    root, because the app stack imports ``app.*``, ``mind`` and ``filters``
+    as top-level names the way ``run.py`` lays them out.
+    """
+
+    global _PATH_READY
+    if _PATH_READY:
+        return
+    # Same final order as the successive insert(0, ...) calls in run.py,
+    # applied with a single slice assignment.
+    server_dirs = _subdirs(SERVER_ROOT)
+    want = [
+        os.path.join(SERVER_ROOT, relative)
+        for relative in ("network", "lib", "core", "app")
+        if relative in server_dirs
+    ]
+    want += (SERVER_ROOT, PROJECT_ROOT)
+    existing = set(sys.path)
+    sys.path[:0] = [folder for folder in want if folder not in existing]
+    _PATH_READY = True
+
+
+_ensure_paths()
+
+
+def _ensure_pkg(name: str, server_dirs: frozenset) -> types.ModuleType:
+    """Expose ``Server/<name>`` as the top-level package ``name``.
+
+    Reuses a module already in ``sys.modules``, then ``Server.<name>``,
+    falling back to an empty module, and makes sure its search path and
+    spec point at the Server directory.
+    """
+
+    module = sys.modules.get(name)
+    if module is None:
         try:  # pragma: no cover - import side effects depend on environment
-            import Server.core as server_core
+            module = importlib.import_module(f"Server.{name}")
         except Exception:
-            core_module = types.ModuleType("core")
-            sys.modules["core"] = core_module
+            module = types.ModuleType(name)
+            sys.modules[name] = module
         else:
-            core_module = server_core
-            sys.modules.setdefault("core", core_module)
+            sys.modules.setdefault(name, module)
+
+    if name not in server_dirs:
+        return module
+    path = os.path.join(SERVER_ROOT, name)
+    search_locations = list(getattr(module, "__path__", []))
+    if path not in search_locations:
+        search_locations.append(path)
+    module.__path__ = search_locations  # type: ignore[attr-defined]
+    if not getattr(module, "__package__", None):
+        module.__package__ = name
+    if not getattr(module, "__file__", None):
+        module.__file__ = os.path.join(path, "__init__.py")
+    spec = getattr(module, "__spec__", None)
+    if not isinstance(spec, importlib.machinery.ModuleSpec) or not getattr(
+        spec, "submodule_search_locations", None
+    ):
+        spec = importlib.machinery.ModuleSpec(name, loader=None, is_package=True)
+        spec.submodule_search_locations = search_locations
+        module.__spec__ = spec  # type: ignore[attr-defined]
+    return module
 
-    interface_module = sys.modules.get("interface")
-    if interface_module is None:
-        try:
-            import Server.interface as server_interface
-        except Exception:
-            interface_module = types.ModuleType("interface")
-            sys.modules["interface"] = interface_module
-        else:
-            interface_module = server_interface
-            sys.modules.setdefault("interface", interface_module)
-    else:
-        sys.modules.setdefault("interface", interface_module)
-
-    core_path = SERVER_ROOT / "core"
-    interface_path = SERVER_ROOT / "interface"
-    llm_path = core_path / "llm"
-    if core_path.exists():
-        search_locations = list(getattr(core_module, "__path__", []))
-        core_path_str = str(core_path)
-        if core_path_str not in search_locations:
-            search_locations.append(core_path_str)
-        if search_locations:
-            core_module.__path__ = search_locations  # type: ignore[attr-defined]
-        if not getattr(core_module, "__package__", None):
-            core_module.__package__ = "core"
-        if not getattr(core_module, "__file__", None):
-            init_file = core_path / "__init__.py"
-            core_module.__file__ = str(init_file)
-        spec = getattr(core_module, "__spec__", None)
-        if not isinstance(spec, importlib.machinery.ModuleSpec) or not getattr(
-            spec, "submodule_search_locations", None
-        ):
-            spec = importlib.machinery.ModuleSpec(
-                "core", loader=None, is_package=True
-            )
-            spec.submodule_search_locations = search_locations or [core_path_str]
-            core_module.__spec__ = spec  # type: ignore[attr-defined]
-    if llm_path.exists():
+
+def _install_sandbox_stubs() -> None:
+    """Wire the ``core``/``interface`` packages and register the stub finder.
+
+    The stand-ins for heavy hardware modules are built lazily by
+    :class:`_SandboxStubFinder` when first imported; the names bound on the
+    packages themselves (``_PACKAGE_ATTRS``) resolve to the same stubs on
+    first attribute access.
+    """
+
+    global _STUBS_READY
+    if _STUBS_READY and "core" in sys.modules and "interface" in sys.modules:
+        return
+    server_dirs = _subdirs(SERVER_ROOT)
+    for name in ("core", "interface"):
+        package = _ensure_pkg(name, server_dirs)
+        # ``from interface import VisionManager`` and ``core.vision`` look
+        # attributes up on the package, which the finder never sees.
+        package.__getattr__ = _lazy_getattr(  # type: ignore[attr-defined]
+            package, _PACKAGE_ATTRS[name]
+        )
+
+    if "core" in server_dirs and "llm" in _subdirs(os.path.join(SERVER_ROOT, "core")):
         persona_spec = importlib.util.find_spec("mind.persona")
         if persona_spec is not None and persona_spec.origin:
-            logging.getLogger("sandbox.cognitive").info(
+            _COGNITIVE_LOGGER.info(
                 "[COGNITIVE] Real persona module linked successfully."
             )
 
-    if interface_path.exists():
-        interface_locations = list(getattr(interface_module, "__path__", []))
-        interface_path_str = str(interface_path)
-        if interface_path_str not in interface_locations:
-            interface_locations.append(interface_path_str)
-        if interface_locations:
-            interface_module.__path__ = interface_locations  # type: ignore[attr-defined]
-        if not getattr(interface_module, "__package__", None):
-            interface_module.__package__ = "interface"
-        if not getattr(interface_module, "__file__", None):
-            init_file = interface_path / "__init__.py"
-            interface_module.__file__ = str(init_file)
-
-    if "cv2" not in sys.modules:
-        cv2_module = types.ModuleType("cv2")
-
-        def setNumThreads(threads: int) -> None:  # pragma: no cover - stub
+    if not any(isinstance(finder, _SandboxStubFinder) for finder in sys.meta_path):
+        sys.meta_path.insert(0, _SandboxStubFinder())
+    _STUBS_READY = True
+
+
+# Stub makers ---------------------------------------------------------------
+# Stub modules are created empty on first import; each attribute below is
+# only built when first looked up through the module's PEP 562 __getattr__.
+
+
+def _make_set_num_threads() -> Callable[[int], None]:
+    def setNumThreads(threads: int) -> None:  # pragma: no cover - stub
+        return None
+
+    return setNumThreads
+
+
+def _make_vision_manager() -> type:
+    class _VisionManager:
+        def __init__(self, *args, **kwargs) -> None:
+            self._running = False
+
+        def start(self) -> None:  # pragma: no cover - stub
+            self._running = True
+
+        def start_stream(
+            self, interval_sec: float = 1.0, on_frame: Optional[callable] = None
+        ) -> None:  # pragma: no cover - stub
+            self._running = True
+
+        def stop(self) -> None:  # pragma: no cover - stub
+            self._running = False
+
+        def get_last_processed_encoded(self):  # pragma: no cover - stub
             return None
 
-        cv2_module.setNumThreads = setNumThreads
-        sys.modules["cv2"] = cv2_module
+        def snapshot(self):  # pragma: no cover - stub
+            return None
 
-    # Vision stubs ---------------------------------------------------------
-    vm_module = sys.modules.get("interface.VisionManager")
-    if vm_module is None:
-        vm_module = types.ModuleType("interface.VisionManager")
-        sys.modules["interface.VisionManager"] = vm_module
+    return _VisionManager
 
-    if not hasattr(vm_module, "VisionManager"):
 
-        class _VisionManager:
-            def __init__(self, *args, **kwargs) -> None:
-                self._running = False
+def _make_register_pipeline() -> Callable[[str, object], None]:
+    def register_pipeline(name: str, pipeline: object) -> None:  # pragma: no cover - stub
+        return None
 
-            def start(self) -> None:  # pragma: no cover - stub
-                self._running = True
+    return register_pipeline
 
-            def start_stream(
-                self, interval_sec: float = 1.0, on_frame: Optional[callable] = None
-            ) -> None:  # pragma: no cover - stub
-                self._running = True
 
-            def stop(self) -> None:  # pragma: no cover - stub
-                self._running = False
+def _make_face_pipeline() -> type:
+    class FacePipeline:  # pragma: no cover - stub
+        def __init__(self, cfg: Optional[Mapping[str, object]] = None) -> None:
+            self.cfg = cfg if cfg is not None else _EMPTY_MAPPING
 
-            def get_last_processed_encoded(self):  # pragma: no cover - stub
-                return None
+    return FacePipeline
 
-            def snapshot(self):  # pragma: no cover - stub
-                return None
 
-        vm_module.VisionManager = _VisionManager
+def _make_movement_control() -> type:
+    class MovementControl:  # pragma: no cover - stub
+        def start_loop(self) -> None:
+            return None
 
-    sys.modules.setdefault("core.VisionManager", vm_module)
-    interface_module.VisionManager = vm_module.VisionManager  # type: ignore[attr-defined]
-    core_module.VisionManager = vm_module.VisionManager  # type: ignore[attr-defined]
+        def stop(self) -> None:
+            return None
 
-    if "core.vision.profile_manager" not in sys.modules:
-        pm_module = types.ModuleType("core.vision.profile_manager")
-        pm_module._profiles = {}
-        sys.modules["core.vision.profile_manager"] = pm_module
-    else:
-        pm_module = sys.modules["core.vision.profile_manager"]
+        def relax(self) -> None:
+            return None
 
-    if "core.vision.api" not in sys.modules:
-        api_module = types.ModuleType("core.vision.api")
+        def turn_left(self, duration_ms: int, speed: float) -> None:
+            return None
 
-        def register_pipeline(name: str, pipeline: object) -> None:  # pragma: no cover - stub
+        def turn_right(self, duration_ms: int, speed: float) -> None:
             return None
 
-        api_module.register_pipeline = register_pipeline
-        sys.modules["core.vision.api"] = api_module
-    else:
-        api_module = sys.modules["core.vision.api"]
+    return MovementControl
 
-    if "core.vision.pipeline.face_pipeline" not in sys.modules:
-        pipeline_module = types.ModuleType("core.vision.pipeline.face_pipeline")
 
-        class FacePipeline:  # pragma: no cover - stub
-            def __init__(self, cfg: Optional[dict] = None) -> None:
-                self.cfg = dict(cfg or {})
+def _make_play_sound() -> Callable[[object], None]:
+    def play_sound(path: object) -> None:  # pragma: no cover - stub
+        _MOCK_VOICE_LOGGER.debug("[MOCK] play_sound(%s)", path)
 
-        pipeline_module.FacePipeline = FacePipeline
-        sys.modules["core.vision.pipeline.face_pipeline"] = pipeline_module
+    return play_sound
 
-    if "core.vision" not in sys.modules:
-        vision_pkg = types.ModuleType("core.vision")
-        sys.modules["core.vision"] = vision_pkg
-    else:
-        vision_pkg = sys.modules["core.vision"]
 
-    vision_pkg.profile_manager = pm_module  # type: ignore[attr-defined]
-    vision_pkg.api = api_module  # type: ignore[attr-defined]
+def _alias_of(target: str, attr: str) -> Callable[[], object]:
+    """Maker re-exporting ``attr`` from the stub module ``target``."""
 
-    pipeline_pkg = sys.modules.get("core.vision.pipeline")
-    if pipeline_pkg is None:
-        pipeline_pkg = types.ModuleType("core.vision.pipeline")
-        sys.modules["core.vision.pipeline"] = pipeline_pkg
-    pipeline_pkg.face_pipeline = sys.modules["core.vision.pipeline.face_pipeline"]
-    vision_pkg.pipeline = pipeline_pkg  # type: ignore[attr-defined]
-    core_module.vision = vision_pkg  # type: ignore[attr-defined]
+    def make() -> object:
+        return getattr(importlib.import_module(target), attr)
 
-    # Movement stubs -------------------------------------------------------
-    movement_module = sys.modules.get("interface.MovementControl")
-    if movement_module is None:
-        movement_module = types.ModuleType("interface.MovementControl")
-        sys.modules["interface.MovementControl"] = movement_module
+    return make
 
-    if not hasattr(movement_module, "MovementControl"):
 
-        class MovementControl:  # pragma: no cover - stub
-            def start_loop(self) -> None:
-                return None
+_STUB_ATTRS: Dict[str, Dict[str, Callable[[], object]]] = {
+    "cv2": {"setNumThreads": _make_set_num_threads},
+    "interface.VisionManager": {"VisionManager": _make_vision_manager},
+    "core.VisionManager": {
+        "VisionManager": _alias_of("interface.VisionManager", "VisionManager")
+    },
+    "core.vision": {},
+    "core.vision.profile_manager": {"_profiles": dict},
+    "core.vision.api": {"register_pipeline": _make_register_pipeline},
+    "core.vision.pipeline": {},
+    "core.vision.pipeline.face_pipeline": {"FacePipeline": _make_face_pipeline},
+    "interface.MovementControl": {"MovementControl": _make_movement_control},
+    "core.MovementControl": {
+        "MovementControl": _alias_of("interface.MovementControl", "MovementControl")
+    },
+    "core.voice.sfx": {"play_sound": _make_play_sound},
+}
+_STUB_PACKAGES = frozenset({"core.vision", "core.vision.pipeline"})
 
-            def stop(self) -> None:
-                return None
 
-            def relax(self) -> None:
-                return None
+def _submodule(name: str) -> Callable[[], object]:
+    return lambda: importlib.import_module(name)
 
-            def turn_left(self, duration_ms: int, speed: float) -> None:
-                return None
 
-            def turn_right(self, duration_ms: int, speed: float) -> None:
-                return None
+# Package attributes the eager stubs used to set on ``core``/``interface``.
+_PACKAGE_ATTRS: Dict[str, Dict[str, Callable[[], object]]] = {
+    "interface": {
+        "VisionManager": _alias_of("interface.VisionManager", "VisionManager"),
+        "MovementControl": _alias_of("interface.MovementControl", "MovementControl"),
+    },
+    "core": {
+        "VisionManager": _alias_of("interface.VisionManager", "VisionManager"),
+        "MovementControl": _alias_of("interface.MovementControl", "MovementControl"),
+        "vision": _submodule("core.vision"),
+        "voice": _submodule("core.voice"),
+    },
+}
+# Third-party packages that are only stubbed when not installed; the Server
+# modules above are always replaced since they drive real hardware.
+_STUB_IF_MISSING = frozenset({"cv2"})
 
-        movement_module.MovementControl = MovementControl
 
-    sys.modules.setdefault("core.MovementControl", movement_module)
-    interface_module.MovementControl = movement_module.MovementControl  # type: ignore[attr-defined]
-    core_module.MovementControl = movement_module.MovementControl  # type: ignore[attr-defined]
+def _lazy_getattr(
+    module: types.ModuleType, makers: Dict[str, Callable[[], object]]
+) -> Callable[[str], object]:
+    def __getattr__(name: str) -> object:
+        try:
+            make = makers[name]
+        except KeyError:
+            raise AttributeError(
+                f"module {module.__name__!r} has no attribute {name!r}"
+            ) from None
+        value = make()
+        setattr(module, name, value)  # later lookups bypass __getattr__
+        return value
 
-    # Audio stubs ----------------------------------------------------------
-    if "core.voice.sfx" not in sys.modules:
-        voice_pkg = sys.modules.get("core.voice")
-        if voice_pkg is None:
-            voice_pkg = types.ModuleType("core.voice")
-            sys.modules["core.voice"] = voice_pkg
-        sfx_module = types.ModuleType("core.voice.sfx")
+    return __getattr__
 
-        def play_sound(path: object) -> None:  # pragma: no cover - stub
-            logging.getLogger("mock.voice").debug("[MOCK] play_sound(%s)", path)
 
-        sfx_module.play_sound = play_sound
-        sys.modules["core.voice.sfx"] = sfx_module
-        voice_pkg.sfx = sfx_module  # type: ignore[attr-defined]
-        core_module.voice = voice_pkg  # type: ignore[attr-defined]
+class _SandboxStubFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    """Serve the hardware stand-in modules above on first import.
 
+    Only consulted for names missing from ``sys.modules``, so modules that
+    were already imported (real or stubbed by a test) are left alone, and
+    only claims the names in ``_STUB_ATTRS``.
+    """
 
-_install_sandbox_stubs()
+    def find_spec(self, fullname, path=None, target=None):
+        if fullname not in _STUB_ATTRS:
+            return None
+        if (
+            fullname in _STUB_IF_MISSING
+            and importlib.machinery.PathFinder.find_spec(fullname, path) is not None
+        ):
+            return None
+        return importlib.util.spec_from_loader(
+            fullname, self, is_package=fullname in _STUB_PACKAGES
+        )
 
-from ..app.application import AppRuntime  # type: ignore  # noqa: E402
-from ..app.builder import AppServices  # type: ignore  # noqa: E402
-from ..app.logging_utils.logging_config import setup_logging  # type: ignore  # noqa: E402
+    def create_module(self, spec):
+        return None
 
-from .mocks import (  # noqa: E402
-    MockLedController,
-    MockMovementService,
-    MockVisionService,
-    MockVoiceService,
-)
-from .mocks.mock_sensors import MockIMU, MockOdometry  # noqa: E402
+    def exec_module(self, module: types.ModuleType) -> None:
+        if module.__name__ in _STUB_PACKAGES:
+            module.__path__ = []  # type: ignore[attr-defined]
+        module.__getattr__ = _lazy_getattr(  # type: ignore[attr-defined]
+            module, _STUB_ATTRS[module.__name__]
+        )
+
+
+_install_sandbox_stubs()
+
+# The app stack, mocks and proprioception modules are imported where they
+# are used, so importing this module for MockSocialFSM or the conversation
+# service does not pull in the whole runtime.
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from ..app.builder import AppServices
+    from ..interface.sensor_gateway import SensorGateway
+    from .mocks import (
+        MockLedController,
+        MockMovementService,
+        MockVisionService,
+        MockVoiceService,
+    )
 
 
 class MockTracker:
     """Minimal tracker compatible with :class:`BehaviorManager` expectations."""
 
+    __slots__ = ("logger", "_debug_on", "enabled")
+
     def __init__(self) -> None:
         self.logger = logging.getLogger("mock.tracker")
+        self._debug_on = self.logger.isEnabledFor(logging.DEBUG)
         self.enabled = True
 
     def set_enabled(
@@ -278,25 +385,47 @@ class MockTracker:
         if enabled is None:
             enabled = bool(enable_x if enable_x is not None else True)
         self.enabled = bool(enabled)
-        self.logger.debug("[MOCK] Tracker enabled=%s", self.enabled)
+        if self._debug_on:
+            self.logger.debug("[MOCK] Tracker enabled=%s", self.enabled)
 
 
 class MockSocialFSM:
     """Lightweight stand-in for the social finite state machine."""
 
+    __slots__ = (
+        "logger",
+        "_log",
+        "_info_on",
+        "state",
+        "paused",
+        "social_muted",
+        "tracker",
+    )
+
+    # Indexed by "face visible" (0/1) in on_frame.
+    _STATES = ("SEARCH", "INTERACT")
+
     def __init__(self) -> None:
         self.logger = logging.getLogger("mock.social_fsm")
+        self._log = self.logger.info
+        self._refresh_log_level()
         self.state = "IDLE"
         self.paused = False
         self.social_muted = False
         self.tracker = MockTracker()
 
+    def _refresh_log_level(self) -> None:
+        # on_frame runs at camera rate; cache the level check so disabled
+        # transitions never build a LogRecord. Re-read on resume().
+        self._info_on = self.logger.isEnabledFor(logging.INFO)
+
     def pause(self) -> None:
         self.paused = True
         self.logger.info("[FSM] paused")
 
     def resume(self) -> None:
         self.paused = False
+        self._refresh_log_level()
         self.logger.info("[FSM] resumed")
 
     def mute_social(self, enabled: bool) -> None:
@@ -309,22 +438,19 @@ class MockSocialFSM:
     def on_frame(self, detection: Optional[dict], dt: float) -> None:
         if self.paused:
             return
-        target_visible = bool(detection and detection.get("face_detected"))
-        if target_visible:
-            self._set_state("INTERACT")
-        else:
-            self._set_state("SEARCH")
-
-    def _set_state(self, new_state: str) -> None:
-        if new_state == self.state:
-            return
-        self.logger.info("[FSM] %s -> %s", self.state, new_state)
-        self.state = new_state
+        visible = 1 if (detection is not None and detection.get("face_detected")) else 0
+        new_state = self._STATES[visible]
+        if new_state != self.state:
+            if self._info_on:
+                self._log("[FSM] %s -> %s", self.state, new_state)
+            self.state = new_state
 
 
 class MockLLMClient:
     """Lightweight canned-response client used when no LLM is reachable."""
 
+    __slots__ = ("_message", "base_url", "_logger")
+
     def __init__(self, *, message: str = "Lumo is not thinking...") -> None:
         self._message = message
         self.base_url = "mock://llm"
@@ -336,34 +462,89 @@ class MockLLMClient:
 
 
 class _SimpleHttpLLMClient:
-    """Minimal HTTP client compatible with the llama.cpp REST API."""
+    """Minimal HTTP client compatible with the llama.cpp REST API.
+
+    A single keep-alive connection is reused across queries and rebuilt
+    after any transport error.
+    """
+
+    __slots__ = (
+        "base_url",
+        "_timeout",
+        "_logger",
+        "_conn_cls",
+        "_netloc",
+        "_path",
+        "_conn",
+        "_lock",
+    )
 
     def __init__(self, base_url: str, *, timeout: float = 10.0) -> None:
         self.base_url = base_url.rstrip("/")
         self._timeout = timeout
         self._logger = logging.getLogger("sandbox.cognitive.http_llm")
+        parts = urllib.parse.urlsplit(self.chat_url)
+        self._conn_cls = (
+            http.client.HTTPSConnection
+            if parts.scheme == "https"
+            else http.client.HTTPConnection
+        )
+        self._netloc = parts.netloc
+        self._path = parts.path
+        self._conn: Optional[http.client.HTTPConnection] = None
+        self._lock = threading.Lock()
 
     @property
     def chat_url(self) -> str:
         return f"{self.base_url}/v1/chat/completions"
 
-    def query(self, messages, *, max_reply_chars: int = 220) -> str:
-        payload = json.dumps({"model": "sandbox", "messages": list(messages)})
-        request = urllib.request.Request(
-            self.chat_url,
-            data=payload.encode("utf-8"),
-            method="POST",
-            headers={"Content-Type": "application/json"},
-        )
+    def close(self) -> None:
+        with self._lock:
+            self._drop_connection()
+
+    def _drop_connection(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _post(self, body: bytes) -> Tuple[int, str, bytes]:
+        reused = self._conn is not None
+        if self._conn is None:
+            self._conn = self._conn_cls(self._netloc, timeout=self._timeout)
         try:
-            with urllib.request.urlopen(request, timeout=self._timeout) as response:
-                data = json.loads(response.read().decode("utf-8"))
-        except urllib.error.HTTPError as exc:  # pragma: no cover - network dependent
-            self._logger.warning("HTTP error querying LLM: %s", exc)
+            self._conn.request(
+                "POST",
+                self._path,
+                body=body,
+                headers={
+                    "Content-Type": "application/json",
+                    "Connection": "keep-alive",
+                },
+            )
+            response = self._conn.getresponse()
+            return response.status, response.reason, response.read()
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            self._drop_connection()
+            if not reused:
+                raise
+            # The server closed an idle keep-alive connection; retry once.
+            return self._post(body)
+        except BaseException:
+            self._drop_connection()
             raise
-        except urllib.error.URLError as exc:  # pragma: no cover - network dependent
+
+    def query(self, messages, *, max_reply_chars: int = 220) -> str:
+        payload = _JSON_ENCODE({"model": "sandbox", "messages": list(messages)})
+        try:
+            with self._lock:
+                status, reason, raw = self._post(payload.encode("utf-8"))
+        except (OSError, http.client.HTTPException) as exc:  # pragma: no cover - network dependent
             self._logger.warning("URL error querying LLM: %s", exc)
             raise
+        if status >= 400:  # pragma: no cover - network dependent
+            self._logger.warning("HTTP error querying LLM: %s %s", status, reason)
+            raise urllib.error.HTTPError(self.chat_url, status, reason, None, None)
+        data = _JSON_DECODE(raw.decode("utf-8"))
 
         choice = data.get("choices") or []
         if choice:
@@ -380,6 +561,8 @@ class _SimpleHttpLLMClient:
 class _SandboxLlamaProcess:
     """Stub ``LlamaServerProcess`` compatible with :class:`ConversationService`."""
 
+    __slots__ = ("port", "_available", "_base_url", "logger")
+
     def __init__(self, *, available: bool, base_url: Optional[str]) -> None:
         self.port = 0
         self._available = available
@@ -417,6 +600,7 @@ class _SandboxLlamaProcess:
         url = f"{(base_url or self._base_url).rstrip('/')}/health"
         retries = max(0, int(max_retries)) + 1
         attempt = 0
+        delay = interval
         last_error: Optional[Exception] = None
         while attempt < retries:
             attempt += 1
@@ -435,7 +619,9 @@ class _SandboxLlamaProcess:
             except urllib.error.URLError as exc:  # pragma: no cover - network dependent
                 last_error = exc
                 self.logger.debug("Health poll attempt %s failed: %s", attempt, exc)
-            time.sleep(min(interval * (backoff ** attempt), 1.0))
+            if attempt < retries:
+                delay = min(delay * backoff, 1.0)
+                time.sleep(delay)
 
         if last_error:
             self.logger.warning("Health checks failed: %s", last_error)
@@ -445,9 +631,71 @@ class _SandboxLlamaProcess:
         self.logger.debug("Sandbox llama process terminate() invoked")
 
 
+_DEFAULT_SYSTEM_PROMPT = "You are Lumo, a friendly companion robot."
+
+
+def _system_message(system_prompt: Optional[str]) -> Dict[str, str]:
+    """Return the system message shared by every turn of a session."""
+
+    return {"role": "system", "content": system_prompt or _DEFAULT_SYSTEM_PROMPT}
+
+
+def _run_turn(
+    utterance: str,
+    *,
+    tts,
+    led,
+    llm,
+    system_msg: Dict[str, str],
+    logger: logging.Logger,
+    set_state: Optional[Callable[[str], None]] = None,
+) -> None:
+    """Answer one utterance: think, query the LLM, speak, return to idle."""
+
+    if set_state is not None:
+        set_state("THINK")
+    led.set_color("thinking")
+    messages = [system_msg, {"role": "user", "content": utterance}]
+    try:
+        reply = llm.query(messages, max_reply_chars=220)
+    except Exception as exc:  # pragma: no cover - network dependent
+        logger.warning("LLM query failed: %s", exc)
+        reply = "I am having trouble thinking right now."
+
+    if set_state is not None:
+        set_state("SPEAK")
+    led.set_color("speaking")
+    tts.speak(reply)
+    if set_state is not None:
+        set_state("IDLE")
+    led.set_color("idle")
+
+
+def _first_set(events: Tuple[threading.Event, ...]) -> Optional[threading.Event]:
+    for event in events:
+        if event.is_set():
+            return event
+    return None
+
+
 class _SandboxConversationManager:
     """Conversation manager used by the sandbox cognitive service."""
 
+    __slots__ = (
+        "_stt",
+        "_tts",
+        "_led",
+        "_llm",
+        "_stop_event",
+        "_extra_stops",
+        "_wait_until_ready",
+        "_logger",
+        "_paused",
+        "_running",
+        "_system_prompt",
+        "_system_msg",
+    )
+
     def __init__(
         self,
         *,
@@ -472,6 +720,7 @@ class _SandboxConversationManager:
         self._paused = False
         self._running = False
         self._system_prompt = system_prompt
+        self._system_msg = _system_message(system_prompt)
 
     def run(self, stop_event: Optional[threading.Event] = None) -> None:
         stop = stop_event or self._stop_event
@@ -479,47 +728,36 @@ class _SandboxConversationManager:
         self._wait_until_ready()
         self._stt.start()
         self._running = True
+        # Every event that ends the loop, deduplicated once per run.
+        stops = tuple(dict.fromkeys((stop, self._stop_event) + self._extra_stops))
         try:
-            while not stop.is_set() and not self._stop_event.is_set():
-                if any(ev.is_set() for ev in self._extra_stops):
-                    self._logger.debug("Additional stop event triggered")
+            while True:
+                fired = _first_set(stops)
+                if fired is not None:
+                    if fired in self._extra_stops:
+                        self._logger.debug("Additional stop event triggered")
                     break
 
                 if self._paused:
-                    time.sleep(0.05)
+                    stop.wait(0.05)
                     continue
 
-                utterance = self._stt.listen()
+                utterance = self._stt.listen(timeout=_LISTEN_TIMEOUT)
                 if utterance is None:
                     continue
                 utterance = utterance.strip()
                 if not utterance:
                     continue
 
-                self._led.set_color("thinking")
                 self._logger.debug("User said: %s", utterance)
-
-                system_prompt = (
-                    self._system_prompt
-                    or "You are Lumo, a friendly companion robot."
+                _run_turn(
+                    utterance,
+                    tts=self._tts,
+                    led=self._led,
+                    llm=self._llm,
+                    system_msg=self._system_msg,
+                    logger=self._logger,
                 )
-                messages = [
-                    {
-                        "role": "system",
-                        "content": system_prompt,
-                    },
-                    {"role": "user", "content": utterance},
-                ]
-
-                try:
-                    reply = self._llm.query(messages, max_reply_chars=220)
-                except Exception as exc:  # pragma: no cover - network dependent
-                    self._logger.warning("LLM query failed: %s", exc)
-                    reply = "I am having trouble thinking right now."
-
-                self._led.set_color("speaking")
-                self._tts.speak(reply)
-                self._led.set_color("idle")
         finally:
             self._running = False
             self._led.set_color("idle")
@@ -549,10 +787,10 @@ def _build_sandbox_manager_factory(
     Dict[str, object],
     Callable[[threading.Event], None],
 ]:
-    stop_ref: Dict[str, threading.Event] = {}
+    state = types.SimpleNamespace(stop_event=None)
 
     def register(event: threading.Event) -> None:
-        stop_ref["stop_event"] = event
+        state.stop_event = event
 
     def factory(
         *,
@@ -565,7 +803,7 @@ def _build_sandbox_manager_factory(
         logger: Optional[logging.Logger] = None,
         **_kwargs,
     ) -> _SandboxConversationManager:
-        stop_event = stop_ref.get("stop_event")
+        stop_event = state.stop_event
         if stop_event is None:
             raise RuntimeError("Sandbox manager stop_event not registered")
         return _SandboxConversationManager(
@@ -587,19 +825,39 @@ def _build_sandbox_manager_factory(
     return factory, manager_kwargs, register
 
 
-def _load_sandbox_config(config_path: Path) -> Dict[str, object]:
+#: ``URLError.reason`` types meaning the LLM host itself is unreachable.
+_UNREACHABLE_ERRORS = (ConnectionRefusedError, socket.gaierror, socket.timeout)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_sandbox_config(config_path: str) -> Mapping[str, object]:
+    """Parse ``config_path`` once per process as a read-only mapping."""
+
     try:
-        with config_path.open("r", encoding="utf-8") as fh:
-            return json.load(fh)
+        with open(config_path, "r", encoding="utf-8") as fh:
+            data = _JSON_DECODE(fh.read())
     except FileNotFoundError:
-        logging.getLogger("sandbox.cognitive").warning(
+        _COGNITIVE_LOGGER.warning(
             "app.json not found at %s", config_path
         )
-    except json.JSONDecodeError as exc:
-        logging.getLogger("sandbox.cognitive").warning(
+    except ValueError as exc:
+        _COGNITIVE_LOGGER.warning(
             "Invalid app.json (%s): %s", config_path, exc
         )
-    return {}
+    else:
+        if isinstance(data, dict):
+            return types.MappingProxyType(data)
+    return _EMPTY_MAPPING
+
+
+@functools.lru_cache(maxsize=1)
+def _conversation_cls() -> type:
+    """Import ``ConversationService`` once; failures are not cached."""
+
+    module = importlib.import_module(
+        "..app.services.conversation_service", __package__
+    )
+    return module.ConversationService
 
 
 class CognitiveConversationService:
@@ -619,14 +877,12 @@ class CognitiveConversationService:
         self._thread: Optional[threading.Thread] = None
         self._running = False
         self._conversation = None
-        self._stop_fallback = threading.Event()
+        self._stop_event = threading.Event()
         self._system_prompt = system_prompt
+        self._system_msg = _system_message(system_prompt)
 
-        config_path = Path(__file__).resolve().parents[1] / "app" / "app.json"
-        self._config = _load_sandbox_config(config_path)
-        conversation_cfg = (
-            self._config.get("conversation") if isinstance(self._config, dict) else {}
-        ) or {}
+        self._config = _load_sandbox_config(_APP_CONFIG_PATH)
+        conversation_cfg = self._config.get("conversation") or {}
         self._llm_base_url = str(
             conversation_cfg.get("llm_server")
             or conversation_cfg.get("llm_base_url")
@@ -636,9 +892,7 @@ class CognitiveConversationService:
     # ------------------------------------------------------------------ helpers
     def _resolve_conversation_class(self):
         try:
-            from ..app.services.conversation_service import ConversationService
-
-            return ConversationService
+            return _conversation_cls()
         except Exception as exc:  # pragma: no cover - import defensive
             self.logger.warning(
                 "Unable to import ConversationService: %s", exc
@@ -660,7 +914,10 @@ class CognitiveConversationService:
             except urllib.error.HTTPError as exc:  # pragma: no cover - network dependent
                 if 400 <= exc.code < 500:
                     return True
-            except urllib.error.URLError:
+            except urllib.error.URLError as exc:
+                if isinstance(exc.reason, _UNREACHABLE_ERRORS):
+                    # Every candidate shares host and port; skip the rest.
+                    break
                 continue
         return False
 
@@ -710,7 +967,7 @@ class CognitiveConversationService:
 
         register(conversation.stop_event)
         if self._system_prompt:
-            logging.getLogger("sandbox.cognitive").info(
+            _COGNITIVE_LOGGER.info(
                 "[COGNITIVE] Using real ConversationService with system prompt."
             )
         return conversation
@@ -718,7 +975,7 @@ class CognitiveConversationService:
     def _start_fallback_loop(self, llm_client) -> None:
         if self._thread and self._thread.is_alive():
             return
-        self._stop_fallback.clear()
+        self._stop_event.clear()
         thread = threading.Thread(
             target=self._loop,
             name="sandbox-conversation",
@@ -729,38 +986,26 @@ class CognitiveConversationService:
         thread.start()
 
     def _loop(self, llm_client) -> None:
-        while not self._stop_fallback.is_set():
-            utterance = self.voice.listen()
+        while not self._stop_event.is_set():
+            utterance = self.voice.listen(timeout=_LISTEN_TIMEOUT)
             if utterance is None:
                 continue
             utterance = utterance.strip()
             if not utterance:
                 continue
 
-            self.state = "THINK"
-            self._led_controller.set_color("thinking")
-            system_prompt = (
-                self._system_prompt
-                or "You are Lumo, a friendly companion robot."
+            _run_turn(
+                utterance,
+                tts=self.voice,
+                led=self._led_controller,
+                llm=llm_client,
+                system_msg=self._system_msg,
+                logger=self.logger,
+                set_state=self._set_state,
             )
-            messages = [
-                {
-                    "role": "system",
-                    "content": system_prompt,
-                },
-                {"role": "user", "content": utterance},
-            ]
-            try:
-                reply = llm_client.query(messages, max_reply_chars=220)
-            except Exception as exc:  # pragma: no cover - network dependent
-                self.logger.warning("Fallback LLM query failed: %s", exc)
-                reply = "I am having trouble thinking right now."
 
-            self.state = "SPEAK"
-            self._led_controller.set_color("speaking")
-            self.voice.speak(reply)
-            self.state = "IDLE"
-            self._led_controller.set_color("idle")
+    def _set_state(self, state: str) -> None:
+        self.state = state
 
     # ------------------------------------------------------------------ API
     def start(self) -> None:
@@ -819,15 +1064,18 @@ class CognitiveConversationService:
             finally:
                 self._conversation.join()
                 self._conversation = None
+            self.voice.stop()
         else:
             self.logger.info("Stopping sandbox fallback loop")
-            self._stop_fallback.set()
+            self._stop_event.set()
+            # Stopping the voice wakes a listen() blocked in the loop, so the
+            # join below returns as soon as the current turn is finished.
+            self.voice.stop()
             thread = self._thread
             if thread and thread.is_alive():
                 thread.join(timeout=1.0)
             self._thread = None
 
-        self.voice.stop()
         self._led_controller.set_color("idle")
         self._running = False
 
@@ -842,48 +1090,56 @@ class CognitiveConversationService:
     def stop_event(self):
         if self._conversation is not None:
             return self._conversation.stop_event
-        return self._stop_fallback
+        return self._stop_event
+
+
+@functools.lru_cache(maxsize=1)
+def _persona_system_prompt() -> Optional[str]:
+    """Build the persona system prompt once per process, or ``None``."""
+
+    try:
+        from ..mind.persona import build_system
+    except Exception as exc:  # pragma: no cover - defensive
+        _COGNITIVE_LOGGER.warning(
+            "[COGNITIVE] Unable to import persona module: %s", exc
+        )
+        return None
+    try:
+        system_prompt = build_system()
+    except Exception as exc:  # pragma: no cover - defensive
+        _COGNITIVE_LOGGER.warning("[COGNITIVE] Failed to build persona: %s", exc)
+        return None
+    _COGNITIVE_LOGGER.info("[COGNITIVE] Persona loaded successfully.")
+    return system_prompt
 
 
 def build_services() -> tuple[AppServices, MockVisionService, MockMovementService, MockVoiceService, MockLedController]:
     """Create mock-backed :class:`AppServices` for the sandbox runtime."""
 
-    config = {"mode": "sandbox"}
+    from ..app.builder import AppServices  # type: ignore
+    from .mocks import (
+        MockLedController,
+        MockMovementService,
+        MockVisionService,
+        MockVoiceService,
+    )
 
-    services = AppServices(cfg=config)
+    services = AppServices(cfg=_SANDBOX_CFG)
     services.enable_vision = True
     services.enable_movement = True
     services.enable_ws = False
     services.enable_conversation = True
     services.interval_sec = 1.0
-    services.conversation_cfg = {"enable": True}
+    services.conversation_cfg = _CONV_CFG
 
     vision = MockVisionService()
     movement = MockMovementService()
     voice = MockVoiceService()
     led = MockLedController()
-    persona_logger = logging.getLogger("sandbox.cognitive")
-    system_prompt: Optional[str] = None
-    try:
-        from ..mind.persona import build_system
-
-        try:
-            system_prompt = build_system()
-        except Exception as exc:  # pragma: no cover - defensive
-            persona_logger.warning(
-                "[COGNITIVE] Failed to build persona: %s", exc
-            )
-        else:
-            persona_logger.info("[COGNITIVE] Persona loaded successfully.")
-    except Exception as exc:  # pragma: no cover - defensive
-        persona_logger.warning(
-            "[COGNITIVE] Unable to import persona module: %s", exc
-        )
-
     conversation = CognitiveConversationService(
         voice,
         led,
-        system_prompt=system_prompt,
+        system_prompt=_persona_system_prompt(),
     )
     social_fsm = MockSocialFSM()
 
@@ -896,6 +1152,9 @@ def build_services() -> tuple[AppServices, MockVisionService, MockMovementServic
 
 
 def main() -> None:
+    from ..app.application import AppRuntime  # type: ignore
+    from ..app.logging_utils.logging_config import setup_logging  # type: ignore
+
     setup_logging()
 
     services, vision, movement, voice, led = build_services()
@@ -909,15 +1168,19 @@ def main() -> None:
     runtime.social_fsm = services.fsm
 
     gateway: Optional[SensorGateway] = None
-    config = _load_sandbox_config(Path(__file__).resolve().parents[1] / "app" / "app.json")
+    config = _load_sandbox_config(_APP_CONFIG_PATH)
 
     # --- SANDBOX PROPRIOCEPTION (mock-only) ---
-    sandbox_cfg = config.get("sandbox", {}) if isinstance(config, dict) else {}
+    sandbox_cfg = config.get("sandbox") or {}
     enable_proprioception = bool(
         sandbox_cfg.get("enable_proprioception", config.get("enable_proprioception", False))
     )
     if enable_proprioception:
         logger.info("[SANDBOX] Enabling proprioception simulation (mock-only)")
+        from ..interface.sensor_controller import SensorController
+        from ..interface.sensor_gateway import SensorGateway
+        from ..mind.proprioception.body_model import BodyModel
+        from .mocks.mock_sensors import MockIMU, MockOdometry
 
         body = BodyModel()
 
@@ -0,0 +1,74 @@
+"""Shared stand-ins for the native and optional libraries the server imports.
+
+Installed once from ``conftest.py`` before any test module is collected.
+Real packages always win: a stub is only registered when the import fails,
+so tests that need the real ``numpy`` (kinematics, posture) keep working
+alongside the ones that only need the imports to succeed.
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+import types
+
+_installed = False
+
+
+def _no_op(*_args, **_kwargs) -> None:
+    return None
+
+
+def _numpy_stubs() -> dict[str, types.ModuleType]:
+    numpy_stub = types.ModuleType("numpy")
+    numpy_stub.ndarray = type("ndarray", (), {})  # type: ignore[attr-defined]
+    numpy_stub.float32 = float  # type: ignore[attr-defined]
+    numpy_stub.uint8 = int  # type: ignore[attr-defined]
+    numpy_typing_stub = types.ModuleType("numpy.typing")
+    numpy_typing_stub.NDArray = object  # type: ignore[attr-defined]
+    numpy_stub.typing = numpy_typing_stub  # type: ignore[attr-defined]
+    return {"numpy": numpy_stub, "numpy.typing": numpy_typing_stub}
+
+
+def _cv2_stubs() -> dict[str, types.ModuleType]:
+    cv2_stub = types.ModuleType("cv2")
+    cv2_stub.COLOR_RGB2BGR = 4  # type: ignore[attr-defined]
+    cv2_stub.COLOR_BGR2RGB = 2  # type: ignore[attr-defined]
+    cv2_stub.setNumThreads = _no_op  # type: ignore[attr-defined]
+    cv2_stub.cvtColor = _no_op  # type: ignore[attr-defined]
+    cv2_stub.VideoCapture = object  # type: ignore[attr-defined]
+    return {"cv2": cv2_stub}
+
+
+def fail_post(*_args, **_kwargs) -> None:  # pragma: no cover - guardrail
+    """Stand-in for ``requests.post``: tests must never reach the network."""
+
+    raise AssertionError("Unexpected HTTP call during tests")
+
+
+def _requests_stubs() -> dict[str, types.ModuleType]:
+    requests_stub = types.ModuleType("requests")
+    requests_stub.post = fail_post  # type: ignore[attr-defined]
+    return {"requests": requests_stub}
+
+
+_STUBS = (
+    ("numpy", _numpy_stubs),
+    ("cv2", _cv2_stubs),
+    ("requests", _requests_stubs),
+)
+
+
+def install_stubs() -> None:
+    """Register stand-ins for whichever of ``_STUBS`` cannot be imported."""
+
+    global _installed
+    if _installed:
+        return
+    for name, build in _STUBS:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            for module_name, module in build().items():
+                sys.modules.setdefault(module_name, module)
+    _installed = True
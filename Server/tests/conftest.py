@@ -1,10 +1,65 @@
 from __future__ import annotations
 
+import importlib
+import importlib.util
 import stat
+import sys
 from pathlib import Path
 
 import pytest
 
+# ``Server/conftest.py`` has already put the Server root on ``sys.path``.
+from _stubs import fail_post, install_stubs
+
+# These need the real numpy; once the stub below is registered their
+# ``importorskip`` would succeed against it, so skip collecting them instead.
+collect_ignore: list[str] = []
+if importlib.util.find_spec("numpy") is None:
+    collect_ignore += ["test_data.py", "test_kinematics.py", "test_posture.py"]
+
+install_stubs()
+
+import requests  # noqa: E402  - the real package or the stub registered above
+
+
+@pytest.fixture(autouse=True)
+def _forbid_http_posts(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make any unmocked ``requests.post`` fail, even with requests installed."""
+
+    monkeypatch.setattr(requests, "post", fail_post)
+
+
+@pytest.fixture(scope="module")
+def sandbox_runtime():
+    """Import the sandbox runtime and undo its import-time side effects.
+
+    The module prepends the Server directories to ``sys.path``, aliases and
+    patches the ``core``/``interface`` packages and registers its stub
+    finder; all of that is rolled back once the requesting test module is
+    done.
+    """
+
+    saved_path = list(sys.path)
+    saved_meta_path = list(sys.meta_path)
+    saved_modules = dict(sys.modules)
+    saved_packages = {
+        name: dict(vars(sys.modules[name]))
+        for name in ("core", "interface")
+        if name in sys.modules
+    }
+    try:
+        yield importlib.import_module("sandbox.sandbox_runtime")
+    finally:
+        sys.path[:] = saved_path
+        sys.meta_path[:] = saved_meta_path
+        for name in set(sys.modules) - set(saved_modules):
+            del sys.modules[name]
+        sys.modules.update(saved_modules)
+        for name, namespace in saved_packages.items():
+            package_vars = vars(sys.modules[name])
+            package_vars.clear()
+            package_vars.update(namespace)
+
 
 @pytest.fixture()
 def dummy_binary(tmp_path: Path) -> Path:
@@ -3,25 +3,6 @@ from __future__ import annotations
 import threading
 import sys
 import types
-from pathlib import Path
-
-cv2_stub = types.ModuleType("cv2")
-numpy_stub = types.ModuleType("numpy")
-
-
-def _no_op(*_args, **_kwargs) -> None:
-    return None
-
-
-cv2_stub.setNumThreads = _no_op  # type: ignore[attr-defined]
-sys.modules.setdefault("cv2", cv2_stub)
-sys.modules.setdefault("numpy", numpy_stub)
-
-numpy_stub.ndarray = type("ndarray", (), {})  # type: ignore[attr-defined]
-
-SERVER_ROOT = Path(__file__).resolve().parents[1]
-if str(SERVER_ROOT) not in sys.path:
-    sys.path.insert(0, str(SERVER_ROOT))
 
 vision_service_stub = types.ModuleType("app.services.vision_service")
 
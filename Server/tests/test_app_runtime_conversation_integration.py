@@ -9,12 +9,7 @@ from pathlib import Path
 from typing import Dict, Iterable, Optional
 
 SERVER_ROOT = Path(__file__).resolve().parents[1]
-if str(SERVER_ROOT) not in sys.path:
-    sys.path.insert(0, str(SERVER_ROOT))
 
-cv2_stub = types.ModuleType("cv2")
-numpy_stub = types.ModuleType("numpy")
-numpy_typing_stub = types.ModuleType("numpy.typing")
 led_controller_stub = types.ModuleType("LedController")
 sounddevice_stub = types.ModuleType("sounddevice")
 vosk_stub = types.ModuleType("vosk")
@@ -61,21 +56,11 @@ def teardown_module() -> None:
     sys.modules.pop("interface", None)
     sys.modules.pop("core", None)
 
-def _no_op(*_args, **_kwargs) -> None:
-    return None
-
-
-cv2_stub.setNumThreads = _no_op  # type: ignore[attr-defined]
-sys.modules.setdefault("cv2", cv2_stub)
-sys.modules.setdefault("numpy", numpy_stub)
-sys.modules.setdefault("numpy.typing", numpy_typing_stub)
 sys.modules.setdefault("LedController", led_controller_stub)
 sys.modules.setdefault("interface.LedController", led_controller_stub)
 sys.modules.setdefault("sounddevice", sounddevice_stub)
 sys.modules.setdefault("vosk", vosk_stub)
 
-numpy_stub.ndarray = type("ndarray", (), {})  # type: ignore[attr-defined]
-numpy_typing_stub.NDArray = object  # type: ignore[attr-defined]
 
 
 class _StubLedController:  # pragma: no cover - minimal shim
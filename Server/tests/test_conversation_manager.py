@@ -2,20 +2,16 @@ import sys
 import threading
 import time
 import types
+from collections import deque
 from pathlib import Path
+from unittest import mock
 
 SERVER_ROOT = Path(__file__).resolve().parents[1]
-if str(SERVER_ROOT) not in sys.path:
-    sys.path.insert(0, str(SERVER_ROOT))
 
 core_stub = types.ModuleType("core")
 core_stub.__path__ = [str(SERVER_ROOT / "core")]
 sys.modules["core"] = core_stub
 
-mind_stub = types.ModuleType("mind")
-mind_stub.__path__ = [str(SERVER_ROOT / "mind")]
-sys.modules["mind"] = mind_stub
-
 interface_stub = types.ModuleType("interface")
 interface_stub.__path__ = [str(SERVER_ROOT / "interface")]
 sys.modules["interface"] = interface_stub
@@ -78,29 +74,21 @@ vosk_stub.Model = _StubModel
 vosk_stub.KaldiRecognizer = _StubRecognizer
 sys.modules["vosk"] = vosk_stub
 
-requests_stub = types.ModuleType("requests")
-
-
-def _fail_post(*_args, **_kwargs):  # pragma: no cover - guardrail
-    raise AssertionError("Unexpected HTTP call during tests")
-
-
-requests_stub.post = _fail_post
-sys.modules["requests"] = requests_stub
-
 from interface.VoiceInterface import ConversationManager
 
 
 class FakeSTT:
     def __init__(self, utterances):
-        self.utterances = list(utterances)
+        self.utterances = deque(utterances)
         self.pause_calls = 0
         self.resume_calls = 0
         self.stopped = False
+        self.done = threading.Event()
 
     def stream(self):
-        for item in self.utterances:
-            yield item
+        while self.utterances:
+            yield self.utterances.popleft()
+        self.done.set()
         while True:
             yield None
 
@@ -131,54 +119,60 @@ class FakeLLM:
         return self.reply
 
 
-class FakeTTS:
-    def __init__(self):
-        self.phrases = []
-        self.event = threading.Event()
+def _spy_tts():
+    """Return a TTS spy plus an event set on its first ``speak`` call."""
 
-    def speak(self, text):
-        self.phrases.append(text)
-        self.event.set()
+    spoke = threading.Event()
+    tts = mock.Mock(spec=["speak"])
+    tts.speak.side_effect = lambda _text: spoke.set()
+    return tts, spoke
 
 
-class FakeLED:
-    def __init__(self):
-        self.states = []
-        self.closed = False
+def _start_manager(stt, llm, tts, stop_event, **overrides):
+    """Build a ConversationManager around the fakes and run it on a thread."""
+
+    options = dict(
+        wait_until_ready=lambda: None,
+        stt_poll_interval=0.01,
+        llm_retry_backoff=2.0,
+        speak_cooldown=0.0,
+    )
+    options.update(overrides)
+    manager = ConversationManager(
+        stt=stt,
+        llm_client=llm,
+        tts=tts,
+        led_controller=mock.Mock(spec=["set_state", "close"]),
+        stop_event=stop_event,
+        **options,
+    )
+    thread = threading.Thread(target=manager.run, daemon=True)
+    thread.start()
+    return manager, thread
 
-    def set_state(self, state):
-        self.states.append(state)
 
-    def close(self):
-        self.closed = True
 def test_llm_backoff_retries_and_metrics():
     stt = FakeSTT(["humo", "hola"])
     llm = FakeLLM(2, reply="ok")
-    tts = FakeTTS()
-    led = FakeLED()
+    tts, spoke = _spy_tts()
     stop_event = threading.Event()
 
-    manager = ConversationManager(
-        stt=stt,
-        llm_client=llm,
-        tts=tts,
-        led_controller=led,
-        stop_event=stop_event,
-        wait_until_ready=lambda: None,
-        stt_poll_interval=0.01,
+    manager, thread = _start_manager(
+        stt,
+        llm,
+        tts,
+        stop_event,
         llm_retry_initial_delay=0.01,
-        llm_retry_backoff=2.0,
         llm_retry_max_attempts=5,
-        speak_cooldown=0.0,
     )
 
-    thread = threading.Thread(target=manager.run, daemon=True)
-    thread.start()
-
-    assert tts.event.wait(3)
+    assert spoke.wait(3)
+    assert stt.done.wait(3)
     stop_event.set()
     thread.join(3)
+    assert not thread.is_alive()
 
+    tts.speak.assert_called_once_with("ok")
     assert llm.calls == 3
     assert manager.metrics.llm_retry_count == 2
     assert manager.metrics.llm_calls == 1
@@ -193,27 +187,17 @@ def test_llm_backoff_retries_and_metrics():
 def test_backoff_respects_stop_event():
     stt = FakeSTT(["humo", "hola"])
     llm = FakeLLM(10)
-    tts = FakeTTS()
-    led = FakeLED()
     stop_event = threading.Event()
 
-    manager = ConversationManager(
-        stt=stt,
-        llm_client=llm,
-        tts=tts,
-        led_controller=led,
-        stop_event=stop_event,
-        wait_until_ready=lambda: None,
-        stt_poll_interval=0.01,
+    _, thread = _start_manager(
+        stt,
+        llm,
+        mock.Mock(spec=["speak"]),
+        stop_event,
         llm_retry_initial_delay=0.1,
-        llm_retry_backoff=2.0,
         llm_retry_max_attempts=10,
-        speak_cooldown=0.0,
     )
 
-    thread = threading.Thread(target=manager.run, daemon=True)
-    thread.start()
-
     assert llm.call_event.wait(2)
     stop_event.set()
     thread.join(2)
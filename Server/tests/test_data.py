@@ -0,0 +1,17 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from core.movement.data import load_points, save_points
+
+
+def test_save_points_rounds_non_integer_points(tmp_path):
+    path = tmp_path / "point.txt"
+    save_points(path, [[0, 99, 10], [0.6, 98.5, -9.7], [-0.6, 99.4, -10.5], [1, 2, 3]])
+
+    assert load_points(path).tolist() == [
+        [0, 99, 10],
+        [1, 98, -10],
+        [-1, 99, -10],
+        [1, 2, 3],
+    ]
@@ -0,0 +1,79 @@
+import asyncio
+import time
+
+import pytest
+
+from core.movement.gait_runner import GaitRunner
+
+
+class _QuarterStepCPG:
+    """Advances leg 0 a quarter phase per update, so one cycle is four ticks."""
+
+    amp_xy_cur = 1.0
+    amp_z_cur = 1.0
+    duty_cur = 0.5
+
+    def __init__(self) -> None:
+        self.phi = [0.0, 0.25, 0.5, 0.75]
+
+    def set_velocity(self, vx, vy, wz) -> None:
+        pass
+
+    def update(self, dt):
+        self.phi = [(p + 0.25) % 1.0 for p in self.phi]
+        return list(self.phi)
+
+    def foot_position(self, phase, duty, stride_len=0.05, lift_height=0.02):
+        return 0.0, 0.0
+
+
+class _Controller:
+    height = 99
+    speed = 100
+
+    def __init__(self) -> None:
+        self.run_times = []
+
+    def clamp_speed(self) -> None:
+        pass
+
+    def speed_scale(self) -> float:
+        return 1.0
+
+    def set_leg_position(self, i, x, y, z) -> None:
+        pass
+
+    def run(self) -> None:
+        self.run_times.append(time.monotonic())
+
+
+def test_step_move_async_paces_ticks_and_counts_cycles() -> None:
+    ctrl = _Controller()
+    runner = GaitRunner(_QuarterStepCPG())
+
+    asyncio.run(runner.step_move_async(ctrl, "X", "forWard", "positive", cycles=2))
+
+    assert len(ctrl.run_times) == 8
+    tick_time = 1.0 / ctrl.speed
+    assert ctrl.run_times[-1] - ctrl.run_times[0] >= 7 * tick_time * 0.9
+
+
+def test_step_move_blocks_outside_an_event_loop() -> None:
+    ctrl = _Controller()
+    runner = GaitRunner(_QuarterStepCPG())
+
+    runner.step_move(ctrl, "Z", "stepLeft", "positive")
+
+    assert len(ctrl.run_times) == 4
+
+
+def test_step_move_rejects_running_loop_thread() -> None:
+    ctrl = _Controller()
+    runner = GaitRunner(_QuarterStepCPG())
+
+    async def _call_blocking() -> None:
+        runner.step_move(ctrl, "X", "forWard", "positive")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(_call_blocking())
+    assert ctrl.run_times == []
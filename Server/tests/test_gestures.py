@@ -0,0 +1,43 @@
+from core.movement.gestures import GesturePlayer, seq_from_table
+
+
+class _RecordingController:
+    def __init__(self) -> None:
+        self.positions = {}
+        self.applied = 0
+
+    def set_leg_position(self, i, x, y, z) -> None:
+        self.positions[i] = (x, y, z)
+
+    def apply_now(self) -> None:
+        self.applied += 1
+
+
+_LEGS = [[10.0, 99.0, 10.0]] * 4
+
+
+def test_threaded_play_sets_started_event() -> None:
+    controller = _RecordingController()
+    player = GesturePlayer(controller=controller, tick_hz=200.0)
+    seq = seq_from_table(
+        "hold", [{"t": 0, "legs": _LEGS}, {"t": 1000, "legs": _LEGS}]
+    )
+    seq.loop = True
+
+    player.play(seq)
+    try:
+        assert player.started_event.wait(1.0)
+        assert player.is_playing()
+    finally:
+        player.stop()
+    assert not player.is_playing()
+
+
+def test_blocking_play_sets_started_event() -> None:
+    controller = _RecordingController()
+    player = GesturePlayer(controller=controller, tick_hz=200.0)
+
+    player.play(seq_from_table("tap", [{"t": 0, "legs": _LEGS}]), blocking=True)
+
+    assert player.started_event.is_set()
+    assert controller.applied >= 1
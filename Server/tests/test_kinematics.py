@@ -0,0 +1,41 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from core.movement import kinematics
+
+
+def _workspace_grid():
+    # Every whole millimetre around the stance: a coarser grid skipped the
+    # points where rounding the acos argument in single precision flipped a
+    # degree.
+    xs = np.arange(-30, 31)
+    ys = np.arange(60, 121)
+    zs = np.arange(-30, 31)
+    grid = np.stack(np.meshgrid(xs, ys, zs, indexing="ij"), axis=-1).reshape(-1, 3)
+    near_misses = [[56.31, 102.79, -21.32], [-13.65, 77.27, 15.72]]
+    return np.concatenate((grid, near_misses))
+
+
+def test_coordinate_to_angle_batch_matches_scalar_over_workspace():
+    points = _workspace_grid()
+    batch = kinematics.coordinate_to_angle_batch(points)
+
+    checked = 0
+    for point, angles in zip(points.tolist(), batch.tolist()):
+        try:
+            expected = kinematics.coordinate_to_angle(*point)
+        except ValueError:
+            assert any(np.isnan(angles))
+            continue
+        assert tuple(angles) == expected, point
+        checked += 1
+    assert checked > len(points) // 2
+
+
+def test_points_in_range_flags_unreachable_poses():
+    reachable = [[0, 99, 10], [0, 99, 10], [0, 99, -10], [0, 99, -10]]
+    too_far = [[0, 140, 10], [0, 99, 10], [0, 99, -10], [0, 99, -10]]
+    assert kinematics.points_in_range([reachable, too_far]).tolist() == [True, False]
+    assert kinematics.check_point(reachable)
+    assert not kinematics.check_point(too_far)
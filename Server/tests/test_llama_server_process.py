@@ -1,14 +1,9 @@
-import sys
 import time
 from pathlib import Path
 from unittest import mock
 
 import pytest
 
-SERVER_ROOT = Path(__file__).resolve().parents[1]
-if str(SERVER_ROOT) not in sys.path:
-    sys.path.insert(0, str(SERVER_ROOT))
-
 from mind.llm.process import LlamaServerProcess
 import mind.llm.process as llama_process_module
 
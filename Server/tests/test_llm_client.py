@@ -1,25 +1,7 @@
 from __future__ import annotations
 
-import sys
-import types
-from pathlib import Path
-
 import pytest
 
-SERVER_ROOT = Path(__file__).resolve().parents[1]
-if str(SERVER_ROOT) not in sys.path:
-    sys.path.insert(0, str(SERVER_ROOT))
-
-requests_stub = types.ModuleType("requests")
-
-
-def _fail_post(*_args, **_kwargs):  # pragma: no cover - guardrail
-    raise AssertionError("Unexpected HTTP call during tests")
-
-
-requests_stub.post = _fail_post
-sys.modules["requests"] = requests_stub
-
 from mind.llm.client import CHAT_ENDPOINT, LlamaClient
 
 
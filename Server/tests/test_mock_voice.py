@@ -0,0 +1,46 @@
+import threading
+import time
+
+from sandbox.mocks.mock_voice import MockVoiceService
+
+
+def test_listen_returns_pushed_text_or_times_out() -> None:
+    voice = MockVoiceService()
+    voice.start()
+    try:
+        voice.push("  hola  ")
+        assert voice.listen(timeout=1.0) == "hola"
+
+        start = time.monotonic()
+        assert voice.listen(timeout=0.05) is None
+        assert time.monotonic() - start >= 0.04
+    finally:
+        voice.stop()
+
+
+def test_stop_wakes_a_blocked_listen() -> None:
+    voice = MockVoiceService()
+    voice.start()
+    heard = []
+    listener = threading.Thread(target=lambda: heard.append(voice.listen(timeout=5.0)))
+    listener.start()
+    time.sleep(0.05)
+
+    voice.stop()
+    listener.join(1.0)
+
+    assert not listener.is_alive()
+    assert heard == [None]
+
+
+def test_restart_discards_the_stop_sentinel() -> None:
+    voice = MockVoiceService()
+    voice.start()
+    voice.stop()
+
+    voice.start()
+    try:
+        voice.push("otra vez")
+        assert voice.listen(timeout=1.0) == "otra vez"
+    finally:
+        voice.stop()
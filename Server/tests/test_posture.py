@@ -0,0 +1,44 @@
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from core.movement.posture import posture_balance
+
+
+def _reference_balance(r, p, y, h, height):
+    """Leg-by-leg evaluation kept as an oracle for the vectorised version."""
+    if h != 0:
+        height = h
+    R, P, Y = (math.radians(v) for v in (r, p, y))
+    rotx = np.array([[1, 0, 0], [0, math.cos(R), -math.sin(R)], [0, math.sin(R), math.cos(R)]])
+    roty = np.array([[math.cos(P), 0, -math.sin(P)], [0, 1, 0], [math.sin(P), 0, math.cos(P)]])
+    rotz = np.array([[math.cos(Y), -math.sin(Y), 0], [math.sin(Y), math.cos(Y), 0], [0, 0, 1]])
+    rot = rotx @ roty @ rotz
+    body = [[68, 38, 0], [68, -38, 0], [-68, 38, 0], [-68, -38, 0]]
+    feet = [[68, 48, height - h], [68, -48, height - h], [-68, 48, height - h], [-68, -48, height - h]]
+    ab = np.zeros((3, 4))
+    for i in range(4):
+        ab[:, i] = np.array([0.0, 0.0, h]) + rot @ np.array(feet[i]) - np.array(body[i])
+    return ab
+
+
+@pytest.mark.parametrize("rpy", [(0, 0, 0), (5, -3, 2), (-10, 10, -10)])
+def test_posture_balance_matches_per_leg_reference(rpy):
+    result = posture_balance(*rpy, 0, height=99)
+    assert result.shape == (3, 4)
+    assert result.dtype == np.float64
+    # Leg targets copied into controller.point must stay ``float`` instances.
+    assert isinstance(result[0, 0], float)
+    assert np.allclose(result, _reference_balance(*rpy, 0, 99), atol=1e-3)
+
+
+def test_posture_balance_writes_into_out_buffer():
+    scratch = np.zeros((3, 4))
+    result = posture_balance(4, -2, 1, 0, height=110, out=scratch)
+    assert result is scratch
+    assert np.allclose(scratch, _reference_balance(4, -2, 1, 0, 110), atol=1e-9)
+    # The cached foot layout must not be disturbed by writes to ``out``.
+    again = posture_balance(4, -2, 1, 0, height=110)
+    assert np.array_equal(again, scratch)
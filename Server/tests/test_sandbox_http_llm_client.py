@@ -0,0 +1,89 @@
+import json
+import threading
+import urllib.error
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+_REPLY = json.dumps({"choices": [{"message": {"content": "hola"}}]}).encode()
+
+
+class _ChatHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers["Content-Length"]))
+        server = self.server
+        server.peers.append(self.client_address)
+        status = server.statuses.pop(0) if server.statuses else 200
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(_REPLY)))
+        self.end_headers()
+        self.wfile.write(_REPLY)
+        # Hang up without a "Connection: close" header, like a server
+        # expiring an idle keep-alive connection.
+        self.close_connection = server.drop_after_reply
+
+    def log_message(self, *_args) -> None:
+        pass
+
+
+@pytest.fixture()
+def chat_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ChatHandler)
+    server.daemon_threads = True
+    server.peers = []
+    server.statuses = []
+    server.drop_after_reply = False
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _client(sandbox_runtime, server):
+    host, port = server.server_address
+    return sandbox_runtime._SimpleHttpLLMClient(f"http://{host}:{port}", timeout=2.0)
+
+
+def test_queries_reuse_one_connection(sandbox_runtime, chat_server) -> None:
+    client = _client(sandbox_runtime, chat_server)
+    try:
+        assert client.query([{"role": "user", "content": "hola"}]) == "hola"
+        assert client.query([{"role": "user", "content": "otra"}]) == "hola"
+    finally:
+        client.close()
+
+    assert len(chat_server.peers) == 2
+    assert chat_server.peers[0] == chat_server.peers[1]
+
+
+def test_retries_once_when_server_closed_the_connection(sandbox_runtime, chat_server) -> None:
+    chat_server.drop_after_reply = True
+    client = _client(sandbox_runtime, chat_server)
+    try:
+        assert client.query([{"role": "user", "content": "hola"}]) == "hola"
+        assert client.query([{"role": "user", "content": "otra"}]) == "hola"
+    finally:
+        client.close()
+
+    assert len(chat_server.peers) == 2
+    assert chat_server.peers[0] != chat_server.peers[1]
+
+
+def test_error_status_raises_http_error(sandbox_runtime, chat_server) -> None:
+    chat_server.statuses = [503]
+    client = _client(sandbox_runtime, chat_server)
+    try:
+        with pytest.raises(urllib.error.HTTPError) as excinfo:
+            client.query([{"role": "user", "content": "hola"}])
+        assert excinfo.value.code == 503
+        assert client.query([{"role": "user", "content": "otra"}]) == "hola"
+    finally:
+        client.close()
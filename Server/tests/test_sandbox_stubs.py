@@ -0,0 +1,64 @@
+import importlib
+import importlib.machinery
+import os
+import sys
+
+
+def _stub_finder(sandbox_runtime):
+    return next(
+        finder
+        for finder in sys.meta_path
+        if isinstance(finder, sandbox_runtime._SandboxStubFinder)
+    )
+
+
+def test_package_attributes_resolve_to_the_stubs(sandbox_runtime) -> None:
+    for name in ("interface.VisionManager", "interface.MovementControl"):
+        sys.modules.pop(name, None)
+    for package in (sys.modules["core"], sys.modules["interface"]):
+        for attr in ("VisionManager", "MovementControl", "vision", "voice"):
+            vars(package).pop(attr, None)
+
+    from interface import MovementControl, VisionManager
+
+    assert VisionManager is importlib.import_module("interface.VisionManager").VisionManager
+    assert VisionManager.__module__ == sandbox_runtime.__name__
+
+    import core
+
+    assert core.VisionManager is VisionManager
+    assert core.MovementControl is MovementControl
+    assert core.vision is importlib.import_module("core.vision")
+    assert core.voice is importlib.import_module("core.voice")
+
+
+def test_every_stub_module_imports_with_its_attributes(sandbox_runtime) -> None:
+    names = [name for name in sandbox_runtime._STUB_ATTRS if name != "cv2"]
+    for name in names:
+        sys.modules.pop(name, None)
+
+    for name in names:
+        module = importlib.import_module(name)
+        assert isinstance(module.__loader__, sandbox_runtime._SandboxStubFinder)
+        for attr in sandbox_runtime._STUB_ATTRS[name]:
+            assert getattr(module, attr) is getattr(module, attr)
+    assert hasattr(importlib.import_module("cv2"), "setNumThreads")
+
+    core_vm = importlib.import_module("core.VisionManager")
+    interface_vm = importlib.import_module("interface.VisionManager")
+    assert core_vm.VisionManager is interface_vm.VisionManager
+    core_mc = importlib.import_module("core.MovementControl")
+    interface_mc = importlib.import_module("interface.MovementControl")
+    assert core_mc.MovementControl is interface_mc.MovementControl
+
+
+def test_finder_leaves_real_modules_alone(sandbox_runtime) -> None:
+    finder = _stub_finder(sandbox_runtime)
+
+    assert finder.find_spec("json") is None
+    assert finder.find_spec("core.movement.kinematics") is None
+    kinematics = importlib.import_module("core.movement.kinematics")
+    assert kinematics.__file__.endswith(os.path.join("core", "movement", "kinematics.py"))
+
+    cv2_installed = importlib.machinery.PathFinder.find_spec("cv2") is not None
+    assert (finder.find_spec("cv2") is None) == cv2_installed
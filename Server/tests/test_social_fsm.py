@@ -2,21 +2,12 @@ from __future__ import annotations
 
 import logging
 import sys
-from pathlib import Path
 from types import SimpleNamespace
 import types
 from unittest.mock import Mock
 
 import pytest
 
-SERVER_ROOT = Path(__file__).resolve().parents[1]
-if str(SERVER_ROOT) not in sys.path:
-    sys.path.insert(0, str(SERVER_ROOT))
-
-cv2_stub = types.ModuleType("cv2")
-cv2_stub.setNumThreads = lambda *args, **kwargs: None  # pragma: no cover - test stub
-sys.modules.setdefault("cv2", cv2_stub)
-
 core_stub = types.ModuleType("core")
 core_stub.__path__ = []  # pragma: no cover - namespace stub
 sys.modules.setdefault("core", core_stub)